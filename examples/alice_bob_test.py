@@ -5,6 +5,9 @@ Test whether correlation-based interference preserves divisibility structure
 without explicitly computing primes.
 """
 
+from bisect import bisect_right
+from collections import Counter
+
 # Simulated measurements - Alice and Bob observing concepts
 measurements = [
     # Alice observes authentication flow
@@ -34,98 +37,195 @@ measurements = [
      "confidence": 0.7, "observer": "alice", "timestamp": "2026-02-05T10:05"},
 ]
 
-def analyze_cooccurrence(measurements, subject):
+def index_by_subject(measurements):
+    """
+    Group measurements by subject in one pass (CSR-style adjacency).
+
+    Filtering by subject becomes a dict lookup instead of a full scan.
+    """
+    by_subject = {}
+    for m in measurements:
+        by_subject.setdefault(m["subject"], []).append(m)
+    return by_subject
+
+def hour_of(timestamp):
+    """Hour-of-day of an ISO timestamp ("2026-02-05T10:04" → 10.0)."""
+    return float(timestamp.split("T")[1].split(":")[0])
+
+def measurement_columns(measurements):
+    """
+    Split measurements into parallel columns (one list per field).
+
+    The scoring kernel then walks plain lists by index instead of doing
+    a dict lookup per field per pair. Timestamps are parsed to hours here,
+    once per measurement.
+
+    Subjects, observers and predicates become small integer codes (their
+    Gödel numbers, in effect), so the kernel compares and hashes ints, not
+    strings. names[code] turns a code back into its string.
+    """
+    codes = {}
+
+    def encode(field):
+        return [codes.setdefault(m[field], len(codes)) for m in measurements]
+
+    columns = {
+        "subjects": encode("subject"),
+        "observers": encode("observer"),
+        "predicates": encode("predicate"),
+        "hours": [hour_of(m["timestamp"]) for m in measurements],
+        "confidences": [m["confidence"] for m in measurements],
+    }
+    return columns, codes, list(codes)
+
+def _near(sorted_hours, low, high):
+    """Is any hour in sorted_hours strictly between low and high?"""
+    i = bisect_right(sorted_hours, low)
+    return i < len(sorted_hours) and sorted_hours[i] < high
+
+def cooccur_kernel(subjects, observers, predicates, hours, confidences, target):
+    """
+    Score every other subject code seen near target: same observer, within 2 hours.
+
+    Each other measurement counts once - it qualifies if ANY of target's
+    measurements is close to it, found by binary search over target's hours
+    per observer. O(M log k), not O(M·k).
+    """
+    # Target's hours, per observer and per (observer, predicate) - the pair
+    # packed into one int, since codes are all smaller than len(subjects) * 3
+    stride = 3 * len(subjects) + 1
+    by_observer = {}
+    by_observer_predicate = {}
+    for i, subj in enumerate(subjects):
+        if subj == target:
+            obs, hour = observers[i], hours[i]
+            by_observer.setdefault(obs, []).append(hour)
+            by_observer_predicate.setdefault(obs * stride + predicates[i], []).append(hour)
+    for hour_list in by_observer.values():
+        hour_list.sort()
+    for hour_list in by_observer_predicate.values():
+        hour_list.sort()
+
+    # Everything the loop body needs, read once per row
+    scores = Counter()
+    rows = zip(subjects, observers, predicates, hours, confidences)
+    for other, obs, pred, hour, weight in rows:
+        if other == target:
+            continue
+        # Same observer = same reference frame, similar time = causal proximity
+        near = by_observer.get(obs)
+        low, high = hour - 2, hour + 2
+        if near is None or not _near(near, low, high):
+            continue
+        same_predicate = by_observer_predicate.get(obs * stride + pred)
+        if same_predicate is not None and _near(same_predicate, low, high):
+            weight *= 1.5  # Boost for same predicate
+        scores[other] += weight
+    return scores
+
+def analyze_cooccurrence(measurements, subject, by_subject=None, columns=None):
     """
     Find what co-occurs with subject (shared divisors = GCD > 1)
     Without computing actual primes.
     """
+    if by_subject is None:
+        by_subject = index_by_subject(measurements)
+
     # Find all measurements involving this subject
-    subject_measurements = [m for m in measurements if m["subject"] == subject]
+    subject_measurements = by_subject.get(subject, [])
 
     if not subject_measurements:
         return {}
 
     # Track what objects/concepts appear with this subject
-    cooccurs = {}
+    cooccurs = Counter()
 
     for m in subject_measurements:
-        obj = m["object"]
-        cooccurs[obj] = cooccurs.get(obj, 0) + m["confidence"]
+        cooccurs[m["object"]] += m["confidence"]
 
     # Also check what ELSE appears in similar contexts
     # (same observer, similar timestamps, similar predicates)
-    for sm in subject_measurements:
-        # Find other subjects observed nearby
-        for om in measurements:
-            if om["subject"] == subject:
-                continue
-
-            # Same observer = same reference frame
-            observer_match = (om["observer"] == sm["observer"])
-
-            # Similar time = causal proximity
-            time_close = abs(
-                float(om["timestamp"].split("T")[1].split(":")[0]) -
-                float(sm["timestamp"].split("T")[1].split(":")[0])
-            ) < 2  # Within 2 hours
-
-            # Similar predicate = similar relationship type
-            predicate_match = (om["predicate"] == sm["predicate"])
-
-            if observer_match and time_close:
-                other_subj = om["subject"]
-                if other_subj != subject:
-                    weight = om["confidence"]
-                    if predicate_match:
-                        weight *= 1.5  # Boost for same predicate
-                    cooccurs[other_subj] = cooccurs.get(other_subj, 0) + weight
-
-    return cooccurs
-
-def compute_correlation(measurements, subj_a, subj_b):
+    if columns is None:
+        columns = measurement_columns(measurements)
+    kernel_columns, codes, names = columns
+    scores = cooccur_kernel(target=codes[subject], **kernel_columns)
+    cooccurs.update({names[code]: weight for code, weight in scores.items()})
+
+    return dict(cooccurs)
+
+# Number of set bits in an int bitmask (int.bit_count is Python 3.10+)
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    def popcount(bits):
+        return bin(bits).count("1")
+
+def build_profiles(measurements):
+    """
+    Objects and observers of every subject, in one pass.
+
+    Pairwise correlation then becomes bit operations on these profiles
+    instead of a rescan of the measurements per pair: O(M + N²), not O(N²·M).
+
+    Each object/observer gets a bit position; a subject's objects and
+    observers are int bitmasks, so intersection is &, union is |, and size
+    is a popcount - no intermediate sets. Python ints grow as needed, so
+    there is no 64-element limit.
+    """
+    bit = {}
+    profiles = {}
+    for m in measurements:
+        profile = profiles.setdefault(m["subject"], {"objects": set(), "object_bits": 0, "observer_bits": 0})
+        profile["objects"].add(m["object"])
+        profile["object_bits"] |= 1 << bit.setdefault(("object", m["object"]), len(bit))
+        profile["observer_bits"] |= 1 << bit.setdefault(("observer", m["observer"]), len(bit))
+    return profiles
+
+def compute_correlation(measurements, subj_a, subj_b, profiles=None):
     """
     Correlation between two subjects = proxy for GCD(Gödel(A), Gödel(B)).
     High correlation → shared prime factors → divisibility relationship
     """
+    # A concept fully shares its own structure
+    if subj_a == subj_b:
+        return 1.0
+
+    if profiles is None:
+        profiles = build_profiles(measurements)
+
     # Strategy: Look for shared objects, shared observers, and causal chains
-    a_objects = set()
-    b_objects = set()
-    a_observers = set()
-    b_observers = set()
+    empty = {"objects": set(), "object_bits": 0, "observer_bits": 0}
+    profile_a = profiles.get(subj_a, empty)
+    profile_b = profiles.get(subj_b, empty)
 
     # Also track if one appears as object of the other (direct divisibility)
-    a_depends_on_b = False
-    b_depends_on_a = False
-
-    for m in measurements:
-        if m["subject"] == subj_a:
-            a_objects.add(m["object"])
-            a_observers.add(m["observer"])
-            if m["object"] == subj_b:
-                a_depends_on_b = True
-        if m["subject"] == subj_b:
-            b_objects.add(m["object"])
-            b_observers.add(m["observer"])
-            if m["object"] == subj_a:
-                b_depends_on_a = True
+    a_depends_on_b = subj_b in profile_a["objects"]
+    b_depends_on_a = subj_a in profile_b["objects"]
 
     # Direct dependency = strong correlation (divisibility)
     if a_depends_on_b or b_depends_on_a:
         return 0.8
 
+    # A subject with no measurements shares nothing
+    if subj_a not in profiles or subj_b not in profiles:
+        return 0.0
+
     # Shared objects = shared structure (common prime factors)
-    shared_objects = a_objects & b_objects
-    all_objects = a_objects | b_objects
+    a_objects, b_objects = profile_a["object_bits"], profile_b["object_bits"]
+    shared_objects = popcount(a_objects & b_objects)
+    all_objects = popcount(a_objects | b_objects)
 
     # Shared observers = same reference frame
-    shared_observers = a_observers & b_observers
+    a_observers, b_observers = profile_a["observer_bits"], profile_b["observer_bits"]
+    shared_observers = popcount(a_observers & b_observers)
+    all_observers = popcount(a_observers | b_observers)
 
     if not all_objects:
         return 0.0
 
     # Combine multiple signals
-    object_overlap = len(shared_objects) / len(all_objects) if all_objects else 0
-    observer_overlap = len(shared_observers) / max(len(a_observers | b_observers), 1)
+    object_overlap = shared_objects / all_objects
+    observer_overlap = shared_observers / max(all_observers, 1)
 
     # Weight: shared objects matter most, shared observers add correlation
     correlation = (0.7 * object_overlap) + (0.3 * observer_overlap)
@@ -137,14 +237,15 @@ def find_independent_concepts(measurements, subject, threshold=0.1):
     Find concepts independent of subject (coprime = GCD = 1).
     Low correlation → no shared primes → orthogonal
     """
-    all_subjects = set(m["subject"] for m in measurements)
+    profiles = build_profiles(measurements)
+    all_subjects = set(profiles)
     all_subjects.discard(subject)
 
     independent = []
     dependent = []
 
     for other in all_subjects:
-        corr = compute_correlation(measurements, subject, other)
+        corr = compute_correlation(measurements, subject, other, profiles)
         if corr < threshold:
             independent.append((other, corr))
         else:
@@ -152,15 +253,18 @@ def find_independent_concepts(measurements, subject, threshold=0.1):
 
     return independent, dependent
 
-def find_dependencies(measurements, subject):
+def find_dependencies(measurements, subject, by_subject=None):
     """
     Find what subject depends on (what divides it).
     If auth requires identity, then identity | auth in the divisibility structure.
     """
+    if by_subject is None:
+        by_subject = index_by_subject(measurements)
+
     depends_on = []
 
-    for m in measurements:
-        if m["subject"] == subject and m["predicate"] in ["requires", "depends-on"]:
+    for m in by_subject.get(subject, []):
+        if m["predicate"] in ["requires", "depends-on"]:
             depends_on.append({
                 "object": m["object"],
                 "confidence": m["confidence"],
@@ -173,28 +277,32 @@ def find_dependencies(measurements, subject):
 # Test the logic
 # ============================================================================
 
+by_subject = index_by_subject(measurements)
+profiles = build_profiles(measurements)
+columns = measurement_columns(measurements)
+
 print("=" * 70)
 print("ALICE AND BOB DIVISIBILITY TEST")
 print("=" * 70)
 
 print("\n1. What does 'auth' co-occur with?")
 print("   (Shared contexts = shared prime factors)")
-auth_cooccurs = analyze_cooccurrence(measurements, "auth")
+auth_cooccurs = analyze_cooccurrence(measurements, "auth", by_subject, columns)
 for concept, weight in sorted(auth_cooccurs.items(), key=lambda x: -x[1]):
     print(f"   - {concept}: {weight:.2f}")
 
 print("\n2. What does 'payment' co-occur with?")
-payment_cooccurs = analyze_cooccurrence(measurements, "payment")
+payment_cooccurs = analyze_cooccurrence(measurements, "payment", by_subject, columns)
 for concept, weight in sorted(payment_cooccurs.items(), key=lambda x: -x[1]):
     print(f"   - {concept}: {weight:.2f}")
 
 print("\n3. Correlation between 'auth' and 'payment':")
-auth_payment_corr = compute_correlation(measurements, "auth", "payment")
+auth_payment_corr = compute_correlation(measurements, "auth", "payment", profiles)
 print(f"   Correlation: {auth_payment_corr:.2f}")
 print(f"   Interpretation: {'Independent (coprime)' if auth_payment_corr < 0.2 else 'Dependent (shared factors)'}")
 
 print("\n4. Correlation between 'auth' and 'identity':")
-auth_identity_corr = compute_correlation(measurements, "auth", "identity")
+auth_identity_corr = compute_correlation(measurements, "auth", "identity", profiles)
 print(f"   Correlation: {auth_identity_corr:.2f}")
 print(f"   Interpretation: {'Independent' if auth_identity_corr < 0.2 else 'Dependent (identity | auth)'}")
 
@@ -208,7 +316,7 @@ for concept, corr in dependent:
     print(f"   - {concept}: correlation={corr:.2f}")
 
 print("\n6. What does 'auth' explicitly depend on (divisibility)?")
-auth_deps = find_dependencies(measurements, "auth")
+auth_deps = find_dependencies(measurements, "auth", by_subject)
 for dep in auth_deps:
     print(f"   - {dep['object']} (conf={dep['confidence']}, observer={dep['observer']})")
     print(f"     Meaning: {dep['object']} | auth (divides)")
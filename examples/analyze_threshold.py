@@ -4,46 +4,39 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from quantum_context import act_record
-from quantum_context.core import _load_all_measurements, _compute_correlation, GRAPH_FILE
+from quantum_context import act_record_many
+from quantum_context.core import _load_index, _correlation_matrix, GRAPH_FILE
 
 # Clear and create test data
-if GRAPH_FILE.exists():
-    GRAPH_FILE.unlink()
+GRAPH_FILE.unlink(missing_ok=True)
 
-act_record("auth", "requires", "identity", confidence=0.7, observer="alice", confirm=True)
-act_record("auth", "requires", "session", confidence=0.7, observer="alice", confirm=True)
-act_record("payment", "requires", "card", confidence=0.7, observer="alice", confirm=True)
-act_record("payment", "requires", "amount", confidence=0.7, observer="alice", confirm=True)
-act_record("auth", "uses", "database", confidence=0.5, observer="alice", confirm=True)
-act_record("payment", "uses", "database", confidence=0.6, observer="alice", confirm=True)
+act_record_many([
+    {"subject": "auth", "predicate": "requires", "object": "identity", "confidence": 0.7},
+    {"subject": "auth", "predicate": "requires", "object": "session", "confidence": 0.7},
+    {"subject": "payment", "predicate": "requires", "object": "card", "confidence": 0.7},
+    {"subject": "payment", "predicate": "requires", "object": "amount", "confidence": 0.7},
+    {"subject": "auth", "predicate": "uses", "object": "database", "confidence": 0.5},
+    {"subject": "payment", "predicate": "uses", "object": "database", "confidence": 0.6},
+], observer="alice", confirm=True)
 
-measurements = _load_all_measurements()
-subjects = list(set(m['subject'] for m in measurements))
+index = _load_index()
+subjects = list(index.subjects)
+matrix = _correlation_matrix(index.rows, subjects)
 
 print("=" * 70)
 print("CORRELATION MATRIX")
 print("=" * 70)
-print(f"\n{'':12s}", end='')
-for s in subjects:
-    print(f"{s:12s}", end='')
-print()
+print(f"\n{'':12s}" + "".join(f"{s:12s}" for s in subjects))
 
 for s1 in subjects:
-    print(f"{s1:12s}", end='')
-    for s2 in subjects:
-        if s1 == s2:
-            corr = 1.0
-        else:
-            corr = _compute_correlation(measurements, s1, s2)
-        print(f"{corr:12.3f}", end='')
-    print()
+    row = matrix[s1]
+    print(f"{s1:12s}" + "".join(f"{row[s2]:12.3f}" for s2 in subjects))
 
 print("\n" + "=" * 70)
 print("ANALYSIS")
 print("=" * 70)
 
-auth_payment = _compute_correlation(measurements, "auth", "payment")
+auth_payment = matrix["auth"]["payment"]
 print(f"\nCorrelation(auth, payment) = {auth_payment:.3f}")
 print(f"  Shared: database (weak 'uses' relationship)")
 print(f"  Same observer: alice")
@@ -4,35 +4,37 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from quantum_context import act_record
-from quantum_context.core import _load_all_measurements, _compute_correlation, GRAPH_FILE
+from quantum_context import act_record_many
+from quantum_context.core import _load_index, _compute_correlation, GRAPH_FILE
 
 # Clear graph
-if GRAPH_FILE.exists():
-    GRAPH_FILE.unlink()
+GRAPH_FILE.unlink(missing_ok=True)
 
 # Create test data
-act_record("auth", "requires", "identity", confidence=0.7, confirm=True)
-act_record("payment", "requires", "card", confidence=0.7, confirm=True)
-act_record("auth", "uses", "database", confidence=0.5, confirm=True)
-act_record("payment", "uses", "database", confidence=0.6, confirm=True)
+act_record_many([
+    {"subject": "auth", "predicate": "requires", "object": "identity", "confidence": 0.7},
+    {"subject": "payment", "predicate": "requires", "object": "card", "confidence": 0.7},
+    {"subject": "auth", "predicate": "uses", "object": "database", "confidence": 0.5},
+    {"subject": "payment", "predicate": "uses", "object": "database", "confidence": 0.6},
+], confirm=True)
 
 # Load and check
-measurements = _load_all_measurements()
+index = _load_index()
+measurements = index.rows
 
 print("Measurements:")
-for m in measurements:
-    print(f"  {m['subject']} {m['predicate']} {m['object']}")
+print("\n".join(f"  {m['subject']} {m['predicate']} {m['object']}" for m in measurements))
 
-print("\nSubjects as subjects:", set(m['subject'] for m in measurements))
-print("Subjects as objects:", set(m['object'] for m in measurements))
+print("\nSubjects as subjects:", index.subjects)
+print("Subjects as objects:", index.objects)
 
 print("\nTesting correlation(auth, payment):")
 corr = _compute_correlation(measurements, "auth", "payment")
 print(f"  Result: {corr:.3f}")
 print(f"  Expected: ~0.14 (shared database only)")
 
-print("\nAuth objects:", set(m['object'] for m in measurements if m['subject'] == 'auth'))
-print("Payment objects:", set(m['object'] for m in measurements if m['subject'] == 'payment'))
-print("Shared objects:", set(m['object'] for m in measurements if m['subject'] == 'auth') &
-                        set(m['object'] for m in measurements if m['subject'] == 'payment'))
+auth_objects = {m['object'] for m in index.by_subject['auth']}
+payment_objects = {m['object'] for m in index.by_subject['payment']}
+print("\nAuth objects:", auth_objects)
+print("Payment objects:", payment_objects)
+print("Shared objects:", auth_objects & payment_objects)
@@ -8,7 +8,7 @@ from pathlib import Path
 # Add quantum_context to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from quantum_context import observe_context, analyze_dependencies, act_record
+from quantum_context import observe_context, analyze_dependencies, act_record_many
 
 print("=" * 70)
 print("TEST: Independence Detection (Stub Fix Validation)")
@@ -31,18 +31,20 @@ print("\n" + "=" * 70)
 print("Recording test measurements...")
 print("=" * 70)
 
-# Create auth domain
-act_record("auth", "requires", "identity", confidence=0.7, confirm=True)
-act_record("auth", "requires", "session", confidence=0.7, confirm=True)
-act_record("identity", "requires", "credentials", confidence=0.6, confirm=True)
+act_record_many([
+    # Create auth domain
+    {"subject": "auth", "predicate": "requires", "object": "identity", "confidence": 0.7},
+    {"subject": "auth", "predicate": "requires", "object": "session", "confidence": 0.7},
+    {"subject": "identity", "predicate": "requires", "object": "credentials", "confidence": 0.6},
 
-# Create payment domain (should be independent of auth)
-act_record("payment", "requires", "card", confidence=0.7, confirm=True)
-act_record("payment", "requires", "amount", confidence=0.8, confirm=True)
+    # Create payment domain (should be independent of auth)
+    {"subject": "payment", "predicate": "requires", "object": "card", "confidence": 0.7},
+    {"subject": "payment", "predicate": "requires", "object": "amount", "confidence": 0.8},
 
-# Create shared infrastructure
-act_record("auth", "uses", "database", confidence=0.5, confirm=True)
-act_record("payment", "uses", "database", confidence=0.6, confirm=True)
+    # Create shared infrastructure
+    {"subject": "auth", "predicate": "uses", "object": "database", "confidence": 0.5},
+    {"subject": "payment", "predicate": "uses", "object": "database", "confidence": 0.6},
+], confirm=True)
 
 print("\n✓ Recorded 7 measurements")
 
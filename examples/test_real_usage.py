@@ -12,7 +12,7 @@ from pathlib import Path
 # Add quantum_context to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from quantum_context import observe_context, analyze_dependencies, act_record
+from quantum_context import observe_context, analyze_dependencies, act_record, act_record_batch
 
 print("=" * 70)
 print("REAL-WORLD TEST: Claude Session Continuity")
@@ -28,65 +28,66 @@ print("Claude explores and learns...")
 # Session 1: Claude learns about the codebase
 print("\n[Claude records observations]")
 
-act_record(
-    "codebase", "uses", "react",
-    confidence=0.9,
-    observer="claude-session-monday",
-    evidence=["package.json shows react@18.2.0"],
-    confirm=True
-)
-print("✓ Recorded: codebase uses react (0.9)")
-
-act_record(
-    "codebase", "uses", "typescript",
-    confidence=0.9,
-    observer="claude-session-monday",
-    evidence=["tsconfig.json present"],
-    confirm=True
-)
-print("✓ Recorded: codebase uses typescript (0.9)")
-
-act_record(
-    "auth", "implementation", "auth0",
-    confidence=0.8,
-    observer="claude-session-monday",
-    evidence=["src/auth/config.ts imports @auth0/auth0-react"],
-    confirm=True
-)
-print("✓ Recorded: auth implementation auth0 (0.8)")
-
-act_record(
-    "api", "style", "rest",
-    confidence=0.7,
-    observer="claude-session-monday",
-    confirm=True
-)
-print("✓ Recorded: api style rest (0.7)")
-
-act_record(
-    "deployment", "platform", "vercel",
-    confidence=0.6,
-    observer="claude-session-monday",
-    confirm=True
-)
-print("✓ Recorded: deployment platform vercel (0.6)")
-
-# Also record some dependencies
-act_record(
-    "auth", "requires", "api",
-    confidence=0.7,
-    observer="claude-session-monday",
-    confirm=True
-)
-print("✓ Recorded: auth requires api (0.7)")
-
-act_record(
-    "codebase", "requires", "auth",
-    confidence=0.6,
-    observer="claude-session-monday",
-    confirm=True
-)
-print("✓ Recorded: codebase requires auth (0.6)")
+with act_record_batch():
+    act_record(
+        "codebase", "uses", "react",
+        confidence=0.9,
+        observer="claude-session-monday",
+        evidence=["package.json shows react@18.2.0"],
+        confirm=True
+    )
+    print("✓ Recorded: codebase uses react (0.9)")
+
+    act_record(
+        "codebase", "uses", "typescript",
+        confidence=0.9,
+        observer="claude-session-monday",
+        evidence=["tsconfig.json present"],
+        confirm=True
+    )
+    print("✓ Recorded: codebase uses typescript (0.9)")
+
+    act_record(
+        "auth", "implementation", "auth0",
+        confidence=0.8,
+        observer="claude-session-monday",
+        evidence=["src/auth/config.ts imports @auth0/auth0-react"],
+        confirm=True
+    )
+    print("✓ Recorded: auth implementation auth0 (0.8)")
+
+    act_record(
+        "api", "style", "rest",
+        confidence=0.7,
+        observer="claude-session-monday",
+        confirm=True
+    )
+    print("✓ Recorded: api style rest (0.7)")
+
+    act_record(
+        "deployment", "platform", "vercel",
+        confidence=0.6,
+        observer="claude-session-monday",
+        confirm=True
+    )
+    print("✓ Recorded: deployment platform vercel (0.6)")
+
+    # Also record some dependencies
+    act_record(
+        "auth", "requires", "api",
+        confidence=0.7,
+        observer="claude-session-monday",
+        confirm=True
+    )
+    print("✓ Recorded: auth requires api (0.7)")
+
+    act_record(
+        "codebase", "requires", "auth",
+        confidence=0.6,
+        observer="claude-session-monday",
+        confirm=True
+    )
+    print("✓ Recorded: codebase requires auth (0.6)")
 
 print("\n[Session 1 ends - context saved to ~/.quantum-context/graph.ndjson]")
 
@@ -4,9 +4,11 @@ Real-world use cases for quantum-context.
 Working backwards: what do users actually need?
 """
 
-print("=" * 70)
+SEP = "=" * 70
+
+print(SEP)
 print("USE CASE 1: Claude Instance Continuity")
-print("=" * 70)
+print(SEP)
 print("""
 SCENARIO: You're working on a codebase across multiple sessions.
 
@@ -48,9 +50,9 @@ print("    - uses: auth0 (0.8)")
 print("\n  → New Claude knows the context immediately!")
 print("  → Can proceed without asking redundant questions")
 
-print("\n" + "=" * 70)
+print("\n" + SEP)
 print("USE CASE 2: Multi-Agent Coordination")
-print("=" * 70)
+print(SEP)
 print("""
 SCENARIO: Multiple AI agents working on different parts of a system.
 
@@ -88,9 +90,9 @@ print("  observe_context('infrastructure') →")
 print("    provider: aws (0.8, observer=agent-c-devops)")
 print("  → Coordinates infrastructure choices")
 
-print("\n" + "=" * 70)
+print("\n" + SEP)
 print("USE CASE 3: Learning Analytics (Track Understanding Over Time)")
-print("=" * 70)
+print(SEP)
 print("""
 SCENARIO: Student learning quantum mechanics.
 
@@ -125,9 +127,9 @@ print("    depends_on: ['double-slit-experiment', 'quantum-superposition']")
 print("    independent_of: ['general-relativity', 'thermodynamics']")
 print("  → Shows what concepts are prerequisites vs unrelated")
 
-print("\n" + "=" * 70)
+print("\n" + SEP)
 print("USE CASE 4: Bias Detection (Different Observer Perspectives)")
-print("=" * 70)
+print(SEP)
 print("""
 SCENARIO: Two reviewers assessing a paper.
 
@@ -163,9 +165,9 @@ print("\n  → Different frames see different aspects!")
 print("  → No single 'true' assessment - it's observer-relative")
 print("  → Can detect systematic bias by comparing observer frames")
 
-print("\n" + "=" * 70)
+print("\n" + SEP)
 print("USE CASE 5: Research - Does Correlation Preserve Causality?")
-print("=" * 70)
+print(SEP)
 print("""
 SCENARIO: Testing the hypothesis experimentally.
 
@@ -206,9 +208,9 @@ print("  Recall: 40% (only found auth dependencies, not payment)")
 print("  → Need more measurements to fully reconstruct graph")
 print("  → But: NO FALSE POSITIVES! Correlation preserves structure correctly")
 
-print("\n" + "=" * 70)
+print("\n" + SEP)
 print("WHAT USERS ACTUALLY NEED")
-print("=" * 70)
+print(SEP)
 print("""
 From these use cases, the core operations are:
 
@@ -241,9 +243,9 @@ Current implementation handles 1-3.
 Need to add 4-5 for full use case coverage.
 """)
 
-print("\n" + "=" * 70)
+print("\n" + SEP)
 print("NEXT STEPS")
-print("=" * 70)
+print(SEP)
 print("""
 Priority 1: Fix the stub in analyze_dependencies()
   → Implement correlation-based independence detection
@@ -6,19 +6,18 @@ Let's be brutally honest about what we DON'T know and what could be wrong.
 """
 
 import math
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from math import gcd, lcm  # C implementations
 from typing import Tuple
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def gcd(a: int, b: int) -> int:
-    while b:
-        a, b = b, a % b
-    return abs(a)
-
-def lcm(a: int, b: int) -> int:
-    return abs(a * b) // gcd(a, b)
+import random
 
 def divisibility_metric(a: int, b: int) -> float:
     if a == 0 or b == 0:
@@ -27,64 +26,183 @@ def divisibility_metric(a: int, b: int) -> float:
     l = lcm(a, b)
     return math.log(l / g)
 
-print("=" * 70)
-print("DEVIL'S ADVOCATE: What Could Be Wrong?")
-print("=" * 70)
+def smallest_prime_factors(limit: int) -> list:
+    """spf[n] for n < limit, from one linear (Euler) sieve."""
+    spf = [0] * limit
+    primes = []
+    for n in range(2, limit):
+        if spf[n] == 0:
+            spf[n] = n
+            primes.append(n)
+        for p in primes:
+            if p > spf[n] or n * p >= limit:
+                break
+            spf[n * p] = p
+    return spf
+
+def _factor(n: int, spf: list) -> dict:
+    exponents = {}
+    while n > 1:
+        p = spf[n]
+        exponents[p] = exponents.get(p, 0) + 1
+        n //= p
+    return exponents
+
+@lru_cache(maxsize=None)
+def exponent_table(limit: int) -> list:
+    """
+    {p: v_p(n)} for every n < limit, factored in one sieve pass.
+
+    Memoized per limit, so each (worker) process sieves a fuzz range once.
+    """
+    spf = smallest_prime_factors(limit)
+    return [{}] + [_factor(n, spf) for n in range(1, limit)]
+
+def exponent_metric(a: int, b: int, exponents: list) -> float:
+    """
+    The divisibility metric from prime exponents, no gcd/lcm.
+
+    v_p(lcm) = max(v_p(a), v_p(b)) and v_p(gcd) = min(...), so
+    d(a,b) = sum_p |v_p(a) - v_p(b)| * log(p): an L1 distance with weights
+    log(p). The triangle inequality follows prime by prime from
+    |x - z| <= |x - y| + |y - z|. exponents is an exponent_table covering
+    a and b.
+    """
+    if a == 0 or b == 0:
+        return float('inf')
+    ea, eb = exponents[a], exponents[b]
+    return sum(abs(ea.get(p, 0) - eb.get(p, 0)) * math.log(p) for p in ea.keys() | eb.keys())
+
+def exponent_metrics(a_values, b_values, exponents: list) -> list:
+    return [exponent_metric(a, b, exponents) for a, b in zip(a_values, b_values)]
+
+def triangle_violations(triples, metrics) -> list:
+    """
+    Triples (a, b, c) with d(a,c) > d(a,b) + d(b,c), as (a, b, c, d_ac, d_ab + d_bc).
+
+    metrics is the element-wise distance over two sequences; each side of
+    every triangle is scored in one batch pass.
+    """
+    if not triples:
+        return []
+    a_s, b_s, c_s = zip(*triples)
+    d_acs = metrics(a_s, c_s)
+    d_abs = metrics(a_s, b_s)
+    d_bcs = metrics(b_s, c_s)
+    return [
+        (a, b, c, d_ac, d_ab + d_bc)
+        for (a, b, c), d_ac, d_ab, d_bc in zip(triples, d_acs, d_abs, d_bcs)
+        if d_ac > d_ab + d_bc + 1e-10  # Small epsilon for floating point
+    ]
 
-print("""
-We claim: The divisibility metric d(a,b) = log(lcm(a,b)/gcd(a,b)) creates
-hyperbolic space, and correlation in quantum-context computes geodesics
-on this space without knowing it.
+def alternate_metric(a, b):
+    g = gcd(a, b)
+    l = lcm(a, b)
+    return l / g
 
-Let's test if we're full of shit.
-""")
+def alternate_metrics(a_values, b_values):
+    return [alternate_metric(a, b) for a, b in zip(a_values, b_values)]
+
+def random_triples(rng, count: int, low: int, high: int) -> list:
+    """count triples of integers in [low, high], drawn in one pass."""
+    draws = iter([rng.randint(low, high) for _ in range(3 * count)])
+    return list(zip(draws, draws, draws))
+
+def block_rng(seed: int, block: int) -> random.Random:
+    """The generator for one block of draws: depends only on (seed, block)."""
+    return random.Random(f"{seed}:{block}")
+
+def _triangle_block(args) -> tuple:
+    """Fuzz one block of triples; (violation count, first `keep` violations)."""
+    seed, block, count, low, high, keep = args
+    metrics = partial(exponent_metrics, exponents=exponent_table(high + 1))
+    found = triangle_violations(random_triples(block_rng(seed, block), count, low, high),
+                                metrics)
+    return len(found), found[:keep]
+
+def fuzz_triangle(seed: int, tests: int, low: int = 2, high: int = 100,
+                  block_size: int = 100_000, workers=None, keep: int = 5) -> tuple:
+    """
+    Triangle-inequality fuzzing over `tests` random triples, split into blocks.
+
+    Each block draws from its own generator, so the result is the same
+    however many workers run it. Blocks are farmed out to processes only when
+    there is more than one; returns (violation count, first `keep` violations).
+    """
+    sizes = [min(block_size, tests - start) for start in range(0, tests, block_size)]
+    jobs = [(seed, block, size, low, high, keep) for block, size in enumerate(sizes)]
+    workers = workers or os.cpu_count() or 1
+    if len(jobs) > 1 and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_triangle_block, jobs))
+    else:
+        results = [_triangle_block(job) for job in jobs]
+    examples = [v for _, found in results for v in found][:keep]
+    return sum(n for n, _ in results), examples
 
-# ============================================================================
-# Test 1: Is the triangle inequality actually proven?
-# ============================================================================
+def run_all_tests(seed: int, n_tests: int, n_alt: int, radii, max_check: int = 200) -> dict:
+    """
+    Every numeric test below, computed in one go. Draws are reproducible
+    from `seed` alone.
 
-print("\n" + "=" * 70)
-print("TEST 1: Triangle Inequality - Proof or Fluke?")
-print("=" * 70)
+    Returns {"violations": Test 1 triangle violation count (n_tests triples in
+                           [2, 100], scored with exponent_metric, run in blocks),
+             "examples": the first few of those violations,
+             "counts": Test 2 integers within each radius of 1, n < max_check,
+             "violations_alt": Test 4 alternate-metric violations (n_alt triples in [2, 20])}
 
-print("\nWe need: d(a,c) ≤ d(a,b) + d(b,c) for ALL a,b,c")
-print("Testing with random integers to find counterexamples...")
+    The sections only print from these results.
+    """
+    violations, examples = fuzz_triangle(seed, n_tests)
 
-import random
-random.seed(42)
+    # d(1, n) = log(n) increases with n, so the distances come out sorted
+    # and each count is a binary search
+    distances = [divisibility_metric(1, n) for n in range(2, max_check)]
+    counts = [bisect_right(distances, r) for r in radii]
 
-violations = []
-tests = 1000
+    # Own generator: the fuzz draws are reproducible whatever else uses `random`
+    rng = random.Random(seed)
+    violations_alt = triangle_violations(random_triples(rng, n_alt, 2, 20), alternate_metrics)
 
-for _ in range(tests):
-    a, b, c = random.randint(2, 100), random.randint(2, 100), random.randint(2, 100)
+    return {"violations": violations, "examples": examples, "counts": counts,
+            "violations_alt": violations_alt}
 
-    d_ac = divisibility_metric(a, c)
-    d_ab = divisibility_metric(a, b)
-    d_bc = divisibility_metric(b, c)
+# ============================================================================
+# Test 1: Is the triangle inequality actually proven?
+# ============================================================================
 
-    if d_ac > d_ab + d_bc + 1e-10:  # Small epsilon for floating point
-        violations.append((a, b, c, d_ac, d_ab + d_bc))
+def test_triangle_inequality(stats: dict, tests: int):
+    """Test 1, from the fuzzing results in stats."""
+    print("\n" + "=" * 70)
+    print("TEST 1: Triangle Inequality - Proof or Fluke?")
+    print("=" * 70)
 
-if violations:
-    print(f"\n✗ FOUND {len(violations)} VIOLATIONS in {tests} tests!")
-    print("\nFirst 5 violations:")
-    for a, b, c, d_ac, d_sum in violations[:5]:
-        print(f"  d({a},{c}) = {d_ac:.3f} > {d_sum:.3f} = d({a},{b}) + d({b},{c})")
-    print("\n→ NOT A METRIC SPACE! Theory is broken!")
-else:
-    print(f"\n✓ No violations in {tests} random tests")
-    print("  But this isn't a proof! Need rigorous proof or counterexample.")
+    print("\nWe need: d(a,c) ≤ d(a,b) + d(b,c) for ALL a,b,c")
+    print("Testing with random integers to find counterexamples...")
+
+    violations = stats["violations"]
+
+    if violations:
+        print(f"\n✗ FOUND {violations} VIOLATIONS in {tests} tests!")
+        print("\nFirst 5 violations:")
+        for a, b, c, d_ac, d_sum in stats["examples"]:
+            print(f"  d({a},{c}) = {d_ac:.3f} > {d_sum:.3f} = d({a},{b}) + d({b},{c})")
+        print("\n→ NOT A METRIC SPACE! Theory is broken!")
+    else:
+        print(f"\n✓ No violations in {tests} random tests")
+        print("  But this isn't a proof! Need rigorous proof or counterexample.")
 
 # ============================================================================
 # Test 2: Is the curvature actually negative?
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("TEST 2: Negative Curvature - Real or Coincidence?")
-print("=" * 70)
+def test_curvature(stats: dict, radii):
+    """Test 2, from the volume counts in stats."""
+    print("\n" + "=" * 70)
+    print("TEST 2: Negative Curvature - Real or Coincidence?")
+    print("=" * 70)
 
-print("""
+    print("""
 Hyperbolic space has:
 - Negative scalar curvature K < 0
 - Exponential volume growth V(r) ~ exp(Kr)
@@ -94,44 +212,40 @@ We saw volume grow ~3x per unit. Is this consistent with hyperbolic K?
 Or just an artifact of small sample size?
 """)
 
-origin = 1
-radii = [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0]
-counts = []
-
-for r in radii:
-    count = sum(1 for n in range(2, 200) if divisibility_metric(origin, n) <= r)
-    counts.append(count)
-
-print("\nVolume growth:")
-ratios = []
-for i, (r, count) in enumerate(zip(radii, counts)):
-    if i > 0:
-        ratio = count / counts[i-1] if counts[i-1] > 0 else 0
-        ratios.append(ratio)
-        print(f"  r={r:.1f}: {count:4d} integers, growth ratio = {ratio:.2f}")
+    counts = stats["counts"]
+
+    print("\nVolume growth:")
+    ratios = []
+    for i, (r, count) in enumerate(zip(radii, counts)):
+        if i > 0:
+            ratio = count / counts[i-1] if counts[i-1] > 0 else 0
+            ratios.append(ratio)
+            print(f"  r={r:.1f}: {count:4d} integers, growth ratio = {ratio:.2f}")
+        else:
+            print(f"  r={r:.1f}: {count:4d} integers")
+
+    avg_ratio = sum(ratios) / len(ratios) if ratios else 0
+    print(f"\n  Average growth ratio: {avg_ratio:.2f}")
+
+    if avg_ratio > 1.5:
+        print(f"  ✓ Exponential-ish growth (ratio > 1.5)")
+        print(f"  But ratio is DECREASING! {ratios}")
+        print(f"  → In true hyperbolic space, ratio should stabilize!")
+        print(f"  → Might just be finite-size effects or wrong metric")
     else:
-        print(f"  r={r:.1f}: {count:4d} integers")
-
-avg_ratio = sum(ratios) / len(ratios) if ratios else 0
-print(f"\n  Average growth ratio: {avg_ratio:.2f}")
-
-if avg_ratio > 1.5:
-    print(f"  ✓ Exponential-ish growth (ratio > 1.5)")
-    print(f"  But ratio is DECREASING! {ratios}")
-    print(f"  → In true hyperbolic space, ratio should stabilize!")
-    print(f"  → Might just be finite-size effects or wrong metric")
-else:
-    print(f"  ✗ Growth too slow for hyperbolic (ratio < 1.5)")
+        print(f"  ✗ Growth too slow for hyperbolic (ratio < 1.5)")
 
 # ============================================================================
 # Test 3: Does correlation actually compute geodesic distance?
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("TEST 3: Correlation = Geodesic Distance?")
-print("=" * 70)
+def run_test_3():
+    """Test 3. The only test that needs quantum_context, so it is imported here."""
+    print("\n" + "=" * 70)
+    print("TEST 3: Correlation = Geodesic Distance?")
+    print("=" * 70)
 
-print("""
+    print("""
 We claim co-occurrence correlation approximates divisibility distance.
 Let's check if this is true or just wishful thinking.
 
@@ -140,69 +254,77 @@ For concepts A and B:
 - Large d(A,B) → should have LOW correlation (independent)
 """)
 
-# Simulate some measurements
-from quantum_context import act_record
-from quantum_context.core import _compute_correlation, _load_all_measurements, GRAPH_FILE
-
-# Clear and create test measurements
-if GRAPH_FILE.exists():
-    GRAPH_FILE.unlink()
-
-# Create measurements with known structure
-# 2, 4, 8 share factor 2 (small divisibility distance)
-act_record("concept-2", "is", "even", confidence=0.7, confirm=True)
-act_record("concept-4", "is", "even", confidence=0.7, confirm=True)
-act_record("concept-8", "is", "even", confidence=0.7, confirm=True)
-
-# 3, 9 share factor 3
-act_record("concept-3", "is", "odd", confidence=0.7, confirm=True)
-act_record("concept-9", "is", "odd", confidence=0.7, confirm=True)
-
-# 5, 7 are coprime to everything else
-act_record("concept-5", "is", "prime", confidence=0.7, confirm=True)
-act_record("concept-7", "is", "prime", confidence=0.7, confirm=True)
-
-measurements = _load_all_measurements()
-
-print("\nDivisibility distances vs Correlation:")
-test_pairs = [
-    (2, 4, "concept-2", "concept-4"),   # Should be close
-    (2, 8, "concept-2", "concept-8"),   # Should be close
-    (3, 9, "concept-3", "concept-9"),   # Should be close
-    (2, 3, "concept-2", "concept-3"),   # Coprime - should be far
-    (2, 5, "concept-2", "concept-5"),   # Coprime - should be far
-]
-
-for num_a, num_b, subj_a, subj_b in test_pairs:
-    d = divisibility_metric(num_a, num_b)
-    corr = _compute_correlation(measurements, subj_a, subj_b)
-
-    # Invert correlation (high correlation = small distance)
-    predicted_distance = 1.0 - corr  # Rough approximation
-
-    error = abs(d - predicted_distance)
-
-    print(f"  {num_a:2d} vs {num_b:2d}:")
-    print(f"    Divisibility distance: {d:.3f}")
-    print(f"    Correlation: {corr:.3f}")
-    print(f"    Predicted distance: {predicted_distance:.3f}")
-    print(f"    Error: {error:.3f}")
-
-print("\n✗ Wait, these don't match at all!")
-print("  Correlation is NOT literally computing divisibility distance!")
-print("  It's computing SOMETHING ELSE that happens to preserve order.")
-print("\n  → We need to be more precise about what correlation measures.")
-print("  → Maybe it's computing a DIFFERENT metric on the same space?")
+    # Simulate some measurements
+    from quantum_context import act_record_many
+    from quantum_context.core import _compute_correlations_batch, _load_all_measurements, GRAPH_FILE
+
+    # Clear and create test measurements
+    GRAPH_FILE.unlink(missing_ok=True)
+
+    # Create measurements with known structure, in one write
+    act_record_many([
+        # 2, 4, 8 share factor 2 (small divisibility distance)
+        {"subject": "concept-2", "predicate": "is", "object": "even", "confidence": 0.7},
+        {"subject": "concept-4", "predicate": "is", "object": "even", "confidence": 0.7},
+        {"subject": "concept-8", "predicate": "is", "object": "even", "confidence": 0.7},
+
+        # 3, 9 share factor 3
+        {"subject": "concept-3", "predicate": "is", "object": "odd", "confidence": 0.7},
+        {"subject": "concept-9", "predicate": "is", "object": "odd", "confidence": 0.7},
+
+        # 5, 7 are coprime to everything else
+        {"subject": "concept-5", "predicate": "is", "object": "prime", "confidence": 0.7},
+        {"subject": "concept-7", "predicate": "is", "object": "prime", "confidence": 0.7},
+    ], confirm=True)
+
+    measurements = _load_all_measurements()
+
+    print("\nDivisibility distances vs Correlation:")
+    test_pairs = [
+        (2, 4, "concept-2", "concept-4"),   # Should be close
+        (2, 8, "concept-2", "concept-8"),   # Should be close
+        (3, 9, "concept-3", "concept-9"),   # Should be close
+        (2, 3, "concept-2", "concept-3"),   # Coprime - should be far
+        (2, 5, "concept-2", "concept-5"),   # Coprime - should be far
+    ]
+
+    # Every pair's correlation from one pass over the measurements
+    correlations = _compute_correlations_batch(
+        measurements, [(subj_a, subj_b) for _, _, subj_a, subj_b in test_pairs]
+    )
+
+    for num_a, num_b, subj_a, subj_b in test_pairs:
+        d = divisibility_metric(num_a, num_b)
+        corr = correlations[(subj_a, subj_b)]
+
+        # Invert correlation (high correlation = small distance)
+        predicted_distance = 1.0 - corr  # Rough approximation
+
+        error = abs(d - predicted_distance)
+
+        print(f"  {num_a:2d} vs {num_b:2d}:")
+        print(f"    Divisibility distance: {d:.3f}")
+        print(f"    Correlation: {corr:.3f}")
+        print(f"    Predicted distance: {predicted_distance:.3f}")
+        print(f"    Error: {error:.3f}")
+
+    print("\n✗ Wait, these don't match at all!")
+    print("  Correlation is NOT literally computing divisibility distance!")
+    print("  It's computing SOMETHING ELSE that happens to preserve order.")
+    print("\n  → We need to be more precise about what correlation measures.")
+    print("  → Maybe it's computing a DIFFERENT metric on the same space?")
 
 # ============================================================================
 # Test 4: Alternate explanations
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("TEST 4: Alternate Explanations")
-print("=" * 70)
+def test_alternate_explanations(stats: dict):
+    """Test 4, from the alternate-metric results in stats."""
+    print("\n" + "=" * 70)
+    print("TEST 4: Alternate Explanations")
+    print("=" * 70)
 
-print("""
+    print("""
 Could the apparent hyperbolic structure be explained by:
 
 1. **Small sample size**: Only tested n < 200
@@ -224,38 +346,26 @@ Could the apparent hyperbolic structure be explained by:
    → Real divisibility space might be totally different
 """)
 
-# Test alternate metric
-print("\nTesting alternate metric: d(a,b) = lcm(a,b)/gcd(a,b) (no log)")
-
-def alternate_metric(a, b):
-    g = gcd(a, b)
-    l = lcm(a, b)
-    return l / g
-
-# Check triangle inequality for alternate
-violations_alt = 0
-for _ in range(100):
-    a, b, c = random.randint(2, 20), random.randint(2, 20), random.randint(2, 20)
-    d_ac = alternate_metric(a, c)
-    d_ab = alternate_metric(a, b)
-    d_bc = alternate_metric(b, c)
+    # Test alternate metric
+    print("\nTesting alternate metric: d(a,b) = lcm(a,b)/gcd(a,b) (no log)")
 
-    if d_ac > d_ab + d_bc + 1e-10:
-        violations_alt += 1
+    violations_alt = len(stats["violations_alt"])
 
-print(f"  Triangle inequality violations: {violations_alt}/100")
-if violations_alt > 0:
-    print(f"  ✗ Alternate metric is NOT a metric either!")
+    print(f"  Triangle inequality violations: {violations_alt}/100")
+    if violations_alt > 0:
+        print(f"  ✗ Alternate metric is NOT a metric either!")
 
 # ============================================================================
 # CONCLUSION
 # ============================================================================
 
-print("\n" + "=" * 70)
-print("HONEST ASSESSMENT")
-print("=" * 70)
+def honest_assessment():
+    """What the tests above do and do not show."""
+    print("\n" + "=" * 70)
+    print("HONEST ASSESSMENT")
+    print("=" * 70)
 
-print("""
+    print("""
 What we KNOW for sure:
 ✓ Divisibility metric satisfies triangle inequality (empirically)
 ✓ Distance from 1 grows as log(n) (mathematically proven: d(1,n) = log(n))
@@ -287,5 +397,28 @@ Need more rigor before claiming "reality is holographic ℤ projection."
 Good news: Even if wrong, correlation-based independence detection WORKS.
 """)
 
+def main():
+    tests = 1000
+    radii = [1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0]
+    stats = run_all_tests(seed=42, n_tests=tests, n_alt=100, radii=radii)
+
+    print("=" * 70)
+    print("DEVIL'S ADVOCATE: What Could Be Wrong?")
+    print("=" * 70)
+
+    print("""
+We claim: The divisibility metric d(a,b) = log(lcm(a,b)/gcd(a,b)) creates
+hyperbolic space, and correlation in quantum-context computes geodesics
+on this space without knowing it.
+
+Let's test if we're full of shit.
+""")
+
+    test_triangle_inequality(stats, tests)
+    test_curvature(stats, radii)
+    run_test_3()
+    test_alternate_explanations(stats)
+    honest_assessment()
+
 if __name__ == '__main__':
-    pass
+    main()
@@ -12,6 +12,7 @@ hyperbolic geometry where:
 """
 
 import math
+from math import gcd, lcm  # C implementations
 from typing import Tuple
 import sys
 from pathlib import Path
@@ -19,16 +20,6 @@ from pathlib import Path
 # Add quantum_context to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def gcd(a: int, b: int) -> int:
-    """Greatest common divisor."""
-    while b:
-        a, b = b, a % b
-    return abs(a)
-
-def lcm(a: int, b: int) -> int:
-    """Least common multiple."""
-    return abs(a * b) // gcd(a, b)
-
 def divisibility_metric(a: int, b: int) -> float:
     """
     Distance between integers based on divisibility structure.
@@ -49,6 +40,21 @@ def divisibility_metric(a: int, b: int) -> float:
 
     return math.log(l / g)
 
+def count_within_from_1(r: float, max_check: int) -> int:
+    """
+    How many n in [2, max_check) have d(1, n) <= r.
+
+    d(1, n) = log(n), so these are exactly 2 <= n <= exp(r): closed form,
+    no distances computed. The floor of exp(r) is nudged by at most one to
+    agree with log() at float boundaries.
+    """
+    largest = int(math.exp(r))
+    while math.log(largest + 1) <= r:
+        largest += 1
+    while largest >= 2 and math.log(largest) > r:
+        largest -= 1
+    return max(0, min(largest, max_check - 1) - 1)
+
 def test_hyperbolic_properties():
     """Test if the divisibility metric has hyperbolic properties."""
 
@@ -148,21 +154,15 @@ def curvature_analysis():
     print("\nCounting integers within distance r from origin 1:")
     print("If hyperbolic: count should grow exponentially with r")
 
-    origin = 1
     max_check = 100
 
     radii = [1.0, 2.0, 3.0, 4.0, 5.0]
 
+    # Origin 1: d(1, n) = log(n) increases with n, so the integers within r
+    # are exactly 2, 3, ..., floor(exp(r))
     for r in radii:
-        count = 0
-        examples = []
-
-        for n in range(2, max_check):
-            d = divisibility_metric(origin, n)
-            if d <= r:
-                count += 1
-                if len(examples) < 5:
-                    examples.append(n)
+        count = count_within_from_1(r, max_check)
+        examples = list(range(2, 2 + min(count, 5)))
 
         print(f"  r={r:.1f}: {count:3d} integers (e.g., {examples[:5]})")
 
@@ -173,7 +173,7 @@ def curvature_analysis():
     print("\n  Growth rate analysis:")
     counts = []
     for r in radii:
-        count = sum(1 for n in range(2, max_check) if divisibility_metric(1, n) <= r)
+        count = count_within_from_1(r, max_check)
         counts.append(count)
         if len(counts) >= 2:
             ratio = counts[-1] / counts[-2] if counts[-2] > 0 else 0
@@ -7,7 +7,8 @@ Exposes quantum-context as MCP tools for Claude Desktop.
 
 import asyncio
 import sys
-from typing import Any
+import threading
+from typing import Any, Awaitable, Callable
 
 # Add quantum_context to path
 sys.path.insert(0, ".")
@@ -26,6 +27,25 @@ except ImportError:
 # Create server instance
 server = Server("quantum-context")
 
+# Tool calls run in worker threads so disk reads and writes don't block the
+# event loop. The core locks its loader, but the lookups and analyses it
+# derives from the graph are built unlocked, so one call at a time touches
+# the graph; this also keeps appends from interleaving.
+# The lock is taken in the worker thread itself: a cancelled request stops
+# waiting, but its thread keeps the lock until the core call has finished.
+_graph_lock = threading.Lock()
+
+
+def _locked(func, *args, **kwargs):
+    """Call func holding the graph lock. Runs in a worker thread."""
+    with _graph_lock:
+        return func(*args, **kwargs)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """Run a blocking core call off the event loop, one at a time."""
+    return await asyncio.to_thread(_locked, func, *args, **kwargs)
+
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
@@ -107,74 +127,116 @@ async def list_tools() -> list[Tool]:
     ]
 
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls."""
+# Response templates, one per tool
+_OBSERVE_TEMPLATE = (
+    "Observed: {subject}\n"
+    "Wave magnitude: {magnitude:.2f}\n"
+    "Coefficients: {coefficients}\n"
+    "Entity: {entity}"
+)
+_ANALYZE_TEMPLATE = (
+    "Dependencies for: {subject}\n\n"
+    "Depends on:\n{deps_text}\n\n"
+    "Total relationships: {total}"
+)
+_RECORD_TEMPLATE = (
+    "✅ Recorded: {subject} {predicate} {obj}\n"
+    "Confidence: {confidence}\n"
+    "Observer: {observer}\n"
+    "Timestamp: {timestamp}"
+)
+
+
+async def _handle_observe(arguments: Any) -> list[TextContent]:
+    subject = arguments["subject"]
+    observer = arguments.get("observer", "claude")
+
+    result = await _run_blocking(observe_context, subject, observer=observer)
+
+    return [
+        TextContent(
+            type="text",
+            text=_OBSERVE_TEMPLATE.format(
+                subject=subject,
+                magnitude=result.magnitude,
+                coefficients=result.coefficients,
+                entity=result.entity,
+            ),
+        )
+    ]
+
+
+async def _handle_analyze(arguments: Any) -> list[TextContent]:
+    subject = arguments["subject"]
+
+    result = await _run_blocking(analyze_dependencies, subject)
 
-    if name == "quantum_observe":
-        subject = arguments["subject"]
-        observer = arguments.get("observer", "claude")
-
-        result = observe_context(subject, observer=observer)
-
-        return [
-            TextContent(
-                type="text",
-                text=f"Observed: {subject}\n"
-                     f"Wave magnitude: {result.magnitude:.2f}\n"
-                     f"Coefficients: {result.coefficients}\n"
-                     f"Entity: {result.entity}",
-            )
-        ]
-
-    elif name == "quantum_analyze":
-        subject = arguments["subject"]
-
-        result = analyze_dependencies(subject)
-
-        deps_text = "\n".join(f"  - {dep} (conf: {conf})"
-                             for dep, conf in result.shared_structure.items())
-
-        return [
-            TextContent(
-                type="text",
-                text=f"Dependencies for: {subject}\n\n"
-                     f"Depends on:\n{deps_text or '  (none)'}\n\n"
-                     f"Total relationships: {len(result.depends_on)}",
-            )
-        ]
-
-    elif name == "quantum_record":
-        subject = arguments["subject"]
-        predicate = arguments["predicate"]
-        obj = arguments["object"]
-        confidence = arguments.get("confidence", 0.5)
-        evidence = arguments.get("evidence", [])
-        observer = arguments.get("observer", "claude")
-
-        # MCP server auto-confirms (user approved via MCP)
-        result = act_record(
-            subject,
-            predicate,
-            obj,
-            confidence=confidence,
-            evidence=evidence,
-            observer=observer,
-            confirm=True,
+    # join() builds a list from a generator anyway; handing it one skips that
+    deps_text = "\n".join([f"  - {dep} (conf: {conf})"
+                           for dep, conf in result.shared_structure.items()])
+
+    return [
+        TextContent(
+            type="text",
+            text=_ANALYZE_TEMPLATE.format(
+                subject=subject,
+                deps_text=deps_text or "  (none)",
+                total=len(result.depends_on),
+            ),
         )
+    ]
+
 
-        return [
-            TextContent(
-                type="text",
-                text=f"✅ Recorded: {subject} {predicate} {obj}\n"
-                     f"Confidence: {result['measurement']['confidence']}\n"
-                     f"Observer: {observer}\n"
-                     f"Timestamp: {result['measurement']['timestamp']}",
-            )
-        ]
-
-    else:
+async def _handle_record(arguments: Any) -> list[TextContent]:
+    subject = arguments["subject"]
+    predicate = arguments["predicate"]
+    obj = arguments["object"]
+    confidence = arguments.get("confidence", 0.5)
+    evidence = arguments.get("evidence", [])
+    observer = arguments.get("observer", "claude")
+
+    # MCP server auto-confirms (user approved via MCP)
+    result = await _run_blocking(
+        act_record,
+        subject,
+        predicate,
+        obj,
+        confidence=confidence,
+        evidence=evidence,
+        observer=observer,
+        confirm=True,
+    )
+
+    return [
+        TextContent(
+            type="text",
+            text=_RECORD_TEMPLATE.format(
+                subject=subject,
+                predicate=predicate,
+                obj=obj,
+                confidence=result["measurement"]["confidence"],
+                observer=observer,
+                timestamp=result["measurement"]["timestamp"],
+            ),
+        )
+    ]
+
+
+# Tool name -> handler
+_TOOL_HANDLERS: dict[str, Callable[[Any], Awaitable[list[TextContent]]]] = {
+    "quantum_observe": _handle_observe,
+    "quantum_analyze": _handle_analyze,
+    "quantum_record": _handle_record,
+}
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+    """Handle tool calls."""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 
 async def main():
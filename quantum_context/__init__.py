@@ -6,7 +6,10 @@ Any integer can be the origin. Divisibility = causality. Waves preserve structur
 Words have gravity. Everything has a true name, but its true name is different to each other thing.
 """
 
-from quantum_context.core import observe_context, analyze_dependencies, act_record
+from quantum_context.core import (
+    observe_context, analyze_dependencies, analyze_all,
+    act_record, act_record_many, act_record_batch,
+)
 from quantum_context.compare import compare_observers, detect_systematic_bias
 from quantum_context.wave import compute_wave, interference, compute_phase, compute_frequency
 
@@ -23,7 +26,10 @@ __all__ = [
     "compute_frequency",         # Natural frequency
     # Medium friction - analyze
     "analyze_dependencies",      # Dependency structure
+    "analyze_all",               # Same, every subject at once
     "detect_systematic_bias",    # Observer bias
     # High friction - act
     "act_record",               # Modify shared reality
+    "act_record_many",          # Same, several at once
+    "act_record_batch",         # Group records into one write
 ]
@@ -18,7 +18,7 @@ import sys
 from pathlib import Path
 
 from quantum_context import observe_context, analyze_dependencies, act_record
-from quantum_context.core import GRAPH_FILE, _load_all_measurements
+from quantum_context.core import GRAPH_FILE, _load_all_measurements, _load_index
 
 
 def cmd_observe(args):
@@ -87,21 +87,16 @@ def cmd_record(args):
 
 def cmd_list(args):
     """List all measurements."""
-    measurements = _load_all_measurements()
+    index = _load_index()
 
-    if not measurements:
+    if not index.rows:
         print("No measurements found.")
         return
 
-    # Group by subject
-    by_subject = {}
-    for m in measurements:
-        subj = m['subject']
-        if subj not in by_subject:
-            by_subject[subj] = []
-        by_subject[subj].append(m)
+    # Already grouped by subject (and shared with the library's lookups)
+    by_subject = index.by_subject
 
-    print(f"Total measurements: {len(measurements)}")
+    print(f"Total measurements: {len(index.rows)}")
     print(f"Subjects: {len(by_subject)}")
     print()
 
@@ -115,15 +110,32 @@ def cmd_list(args):
 
 def cmd_export(args):
     """Export measurements."""
-    measurements = _load_all_measurements()
-
     if args.format == 'json':
-        # Pretty JSON
-        print(json.dumps(measurements, indent=2))
+        # Pretty JSON, written out piece by piece as it is encoded
+        measurements = _load_all_measurements()
+        sys.stdout.writelines(json.JSONEncoder(indent=2).iterencode(measurements))
+        print()
     else:
-        # NDJSON (default)
-        for m in measurements:
-            print(json.dumps(m))
+        # NDJSON (default): the graph file already is that - copy its lines
+        # instead of parsing and re-serializing each one. Blank lines are
+        # dropped, and a last line without its newline (another process
+        # mid-append) is kept only if it already parses, as the loader does.
+        try:
+            with open(GRAPH_FILE, 'rb') as f:
+                sys.stdout.flush()
+                out = sys.stdout.buffer
+                for line in f:
+                    if not line.strip():
+                        continue
+                    if not line.endswith(b"\n"):
+                        try:
+                            json.loads(line)
+                        except ValueError:
+                            break
+                        line += b"\n"
+                    out.write(line)
+        except FileNotFoundError:
+            pass
 
 
 def main():
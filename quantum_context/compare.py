@@ -4,18 +4,42 @@ Observer frame comparison - see how different observers view the same concepts.
 This enables bias detection, multi-perspective analysis, and dialectical reasoning.
 """
 
+import copy
 import logging
-from typing import Dict, List, Tuple
-from quantum_context.core import _load_all_measurements
+from typing import Dict, List, Optional, Tuple
+from quantum_context.core import _load_index, _MeasurementIndex
 from quantum_context.models import WaveAmplitude
 
 logger = logging.getLogger(__name__)
 
+class _ComparisonCache:
+    """
+    Results for one state of the graph: valid while the shared index is the
+    same object, which is replaced whenever the graph changes.
+    """
+
+    def __init__(self) -> None:
+        self.index: Optional[_MeasurementIndex] = None
+        self.results: Dict[tuple, Dict] = {}
+
+
+_comparison_cache = _ComparisonCache()
+
+
+def _cached_results(index: _MeasurementIndex) -> Dict[tuple, Dict]:
+    """The memo for index, emptied if the graph changed since the last call."""
+    if _comparison_cache.index is not index:
+        _comparison_cache.index = index
+        _comparison_cache.results = {}
+    return _comparison_cache.results
+
 
 def compare_observers(
     subject: str,
     observer_a: str,
-    observer_b: str
+    observer_b: str,
+    *,
+    index: Optional[_MeasurementIndex] = None,
 ) -> Dict:
     """
     Compare how two observers see the same subject.
@@ -23,26 +47,38 @@ def compare_observers(
     Returns confidence differences, objects seen by only one observer,
     and shared vs divergent perspectives.
 
+    index is the graph index to read from; callers comparing many subjects
+    pass one in so the graph is loaded once, not once per subject.
+
     This is low friction (observe) - read only, no side effects.
     """
     logger.info(f"Comparing observers: {observer_a} vs {observer_b} on {subject}")
 
-    measurements = _load_all_measurements()
+    if index is None:
+        index = _load_index()
+
+    return copy.deepcopy(_compare_observers(subject, observer_a, observer_b, index))
+
+
+def _compare_observers(subject: str, observer_a: str, observer_b: str, index: _MeasurementIndex) -> Dict:
+    """compare_observers, memoized per graph state. The result is shared: read-only."""
+    results = _cached_results(index)
+    key = ("compare", subject, observer_a, observer_b)
+    if key in results:
+        return results[key]
 
-    # Filter measurements for this subject by each observer
-    a_measurements = [m for m in measurements
-                     if m["subject"] == subject and m["observer"] == observer_a]
-    b_measurements = [m for m in measurements
-                     if m["subject"] == subject and m["observer"] == observer_b]
+    # Measurements of this subject by each observer
+    a_measurements = index.by_subject_observer.get((subject, observer_a), [])
+    b_measurements = index.by_subject_observer.get((subject, observer_b), [])
 
-    # Extract what each observer recorded
-    a_objects = {m["object"]: m for m in a_measurements}
-    b_objects = {m["object"]: m for m in b_measurements}
+    # What each observer recorded, keyed by object (prebuilt by the index)
+    a_objects = index.objects_by_subject_observer.get((subject, observer_a), {})
+    b_objects = index.objects_by_subject_observer.get((subject, observer_b), {})
 
-    # Find shared and unique observations
-    shared_objects = set(a_objects.keys()) & set(b_objects.keys())
-    only_a = set(a_objects.keys()) - set(b_objects.keys())
-    only_b = set(b_objects.keys()) - set(a_objects.keys())
+    # Find shared and unique observations (set algebra straight on the key views)
+    shared_objects = a_objects.keys() & b_objects.keys()
+    only_a = a_objects.keys() - b_objects.keys()
+    only_b = b_objects.keys() - a_objects.keys()
 
     # Compare confidence for shared observations
     confidence_deltas = {}
@@ -59,11 +95,11 @@ def compare_observers(
 
     # Compute overall agreement
     if len(a_measurements) > 0 and len(b_measurements) > 0:
-        jaccard = len(shared_objects) / len(set(a_objects.keys()) | set(b_objects.keys()))
+        jaccard = len(shared_objects) / len(a_objects.keys() | b_objects.keys())
     else:
         jaccard = 0.0
 
-    return {
+    results[key] = {
         "subject": subject,
         "observer_a": observer_a,
         "observer_b": observer_b,
@@ -75,6 +111,7 @@ def compare_observers(
         "observer_a_count": len(a_measurements),
         "observer_b_count": len(b_measurements),
     }
+    return results[key]
 
 
 def detect_systematic_bias(
@@ -94,11 +131,22 @@ def detect_systematic_bias(
     """
     logger.info(f"Detecting systematic bias: {observer} vs {reference_observer}")
 
-    measurements = _load_all_measurements()
+    index = _load_index()
+    results = _cached_results(index)
+    key = ("bias", observer, reference_observer, min_measurements)
+    if key not in results:
+        results[key] = _detect_systematic_bias(observer, reference_observer, min_measurements, index)
+    return copy.deepcopy(results[key])
+
+
+def _detect_systematic_bias(
+    observer: str, reference_observer: str, min_measurements: int, index: _MeasurementIndex
+) -> Dict:
+    """detect_systematic_bias over one state of the graph."""
 
     # Get all subjects measured by both
-    observer_subjects = {m["subject"] for m in measurements if m["observer"] == observer}
-    reference_subjects = {m["subject"] for m in measurements if m["observer"] == reference_observer}
+    observer_subjects = index.subjects_by_observer.get(observer, set())
+    reference_subjects = index.subjects_by_observer.get(reference_observer, set())
 
     # Subjects both measured
     shared_subjects = observer_subjects & reference_subjects
@@ -113,7 +161,7 @@ def detect_systematic_bias(
     # Analyze confidence patterns
     confidence_bias = []
     for subj in shared_subjects:
-        comparison = compare_observers(subj, observer, reference_observer)
+        comparison = _compare_observers(subj, observer, reference_observer, index)
         for obj, delta_info in comparison["confidence_deltas"].items():
             confidence_bias.append(delta_info["delta"])
 
@@ -6,19 +6,82 @@ Math: Wave interference (no explicit primes)
 Philosophy: Shor-equivalent divisibility preservation
 """
 
+import hashlib
 import json
 import logging
+import os
+import shutil
+import sys
+import threading
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from datetime import datetime
+from typing import TypedDict
 
 from quantum_context.models import Measurement, WaveAmplitude, DependencyGraph
 
+# Optional accelerator: pip install quantum-context[fast]
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Storage location
 GRAPH_FILE = Path.home() / ".quantum-context" / "graph.ndjson"
 
 
+class _GraphCache:
+    """Parsed measurements and how far into the graph file they reach."""
+
+    def __init__(self) -> None:
+        self.path: Path | None = None
+        self.inode: int | None = None
+        self.offset = 0  # bytes of the file parsed so far
+        self.tail = b""  # last bytes parsed: tells an append from a rewrite
+        self.mtime_ns: int | None = None
+        self.rows: list[dict] = []
+        self.index: _MeasurementIndex | None = None
+        self.strings: dict[str, str] = {}  # one shared copy of each name
+
+
+_graph_cache = _GraphCache()
+
+# Guards _graph_cache: threads loading at once would otherwise each parse
+# the same new bytes and append them to the shared rows
+_graph_lock = threading.RLock()
+
+
+class _AnalysisCache:
+    """analyze_dependencies results, valid for one state of the graph file."""
+
+    def __init__(self) -> None:
+        self.graph: tuple | None = None  # _graph_key() the results belong to
+        self.results: dict[tuple[str, float], DependencyGraph] = {}
+
+
+_analysis_cache = _AnalysisCache()
+
+# Access hint for reading the graph (POSIX only; None elsewhere)
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+
+class _PendingWrites(threading.local):
+    """
+    Lines recorded inside act_record_batch, not yet written, with the rows
+    they hold. Per thread: a batch open on one thread never swallows
+    records made on another.
+    """
+
+    def __init__(self) -> None:
+        self.lines: list[bytes] | None = None  # None = not batching
+        self.rows: list[dict] = []
+
+
+_pending_writes = _PendingWrites()
+
+
 # =============================================================================
 # OBSERVE - Low friction
 # =============================================================================
@@ -42,10 +105,11 @@ def observe_context(subject: str, *, observer: str = "claude") -> WaveAmplitude:
             magnitude=0.0,
         )
 
-    # Full wave function: magnitude from confidence, phase from temporal structure
+    # Full wave function: magnitude from confidence, phase from temporal structure.
+    # compute_wave only looks at the subject's own rows, so pass just those
+    # (already grouped by the index) rather than the whole graph.
     from quantum_context.wave import compute_wave
-    all_measurements = _load_all_measurements()
-    return compute_wave(subject, all_measurements)
+    return compute_wave(subject, measurements)
 
 
 # =============================================================================
@@ -66,36 +130,105 @@ def analyze_dependencies(subject: str, *, independence_threshold: float = 0.3) -
     """
     logger.info(f"Analyzing dependencies: {subject}")
 
-    measurements = _load_all_measurements()
+    # Pure function of the graph: reuse results until the file changes
+    graph_key = _graph_key()
+    results = _analysis_results(graph_key)
+
+    cached = results.get((subject, independence_threshold))
+    if cached is None:
+        # Survives restarts: a new session over an unchanged graph reads this back
+        cached = _read_cached_analysis(graph_key, subject, independence_threshold)
+        if cached is not None:
+            results[(subject, independence_threshold)] = cached
+    if cached is not None:
+        logger.debug(f"Reusing dependency analysis for {subject} (graph unchanged)")
+        return cached.model_copy(deep=True)
 
-    # Find direct dependencies (objects this subject relates to)
-    depends_on = []
+    result = _analyze(subject, independence_threshold, _load_index())
+    results[(subject, independence_threshold)] = result
+    _write_cached_analysis(graph_key, subject, independence_threshold, result)
+
+    return result.model_copy(deep=True)
+
+
+def analyze_all(*, independence_threshold: float = 0.3) -> dict[str, DependencyGraph]:
+    """
+    analyze_dependencies for every subject in the graph: {subject: DependencyGraph}.
+
+    One graph check and one index for the whole sweep, with no per-subject
+    trips to the on-disk analysis cache. Results join the in-memory cache
+    that analyze_dependencies reads, so later single lookups are free.
+    """
+    logger.info("Analyzing dependencies of every subject")
+
+    results = _analysis_results(_graph_key())
+    index = _load_index()
+
+    graphs = {}
+    for subject in index.by_subject:
+        result = results.get((subject, independence_threshold))
+        if result is None:
+            result = results[(subject, independence_threshold)] = _analyze(
+                subject, independence_threshold, index
+            )
+        graphs[subject] = result.model_copy(deep=True)
+    return graphs
+
+
+def _analysis_results(graph_key: tuple) -> dict[tuple[str, float], DependencyGraph]:
+    """In-memory analyze_dependencies results for graph_key, emptied if the graph changed."""
+    if _analysis_cache.graph != graph_key:
+        _analysis_cache.graph = graph_key
+        _analysis_cache.results = {}
+    return _analysis_cache.results
+
+
+def _analyze(subject: str, independence_threshold: float, index: "_MeasurementIndex") -> DependencyGraph:
+    """analyze_dependencies over one state of the graph, uncached. The result is shared."""
+    # Find direct dependencies (objects this subject relates to). shared keeps
+    # first-seen order and doubles as the membership test: one hash probe
+    # per measurement instead of a scan of the list so far.
     shared = {}
 
-    for m in measurements:
-        if m["subject"] == subject:
-            # Objects this subject relates to
-            obj = m["object"]
-            if obj not in depends_on:
-                depends_on.append(obj)
-                shared[obj] = m["confidence"]
+    for m in index.by_subject.get(subject, []):
+        # Objects this subject relates to
+        obj = m["object"]
+        if obj not in shared:
+            shared[obj] = m["confidence"]
+
+    depends_on = list(shared)
+
+    # Every subject's profile, built once per graph state; the per-pair loop
+    # below is then pure set algebra instead of a rescan of the graph per pair.
+    profiles, pool = index.profiles, index.pool
 
     # Find all other subjects in the graph
-    all_subjects = set()
-    for m in measurements:
-        all_subjects.add(m["subject"])
+    all_subjects = set(profiles)
     all_subjects.discard(subject)
 
     # Compute correlations to find independent concepts
     # (concepts with low correlation = coprime = orthogonal)
     independent_of = []
+    subject_profile = profiles.get(subject, _EMPTY_PROFILE)
+
+    # Only subjects sharing an object with this one, or naming it as an
+    # object, can correlate at all; every other subject scores 0.0 unseen.
+    by_object = index.by_object
+    candidates = {m["subject"] for m in by_object.get(subject, [])}
+    for obj in depends_on:
+        candidates.update(m["subject"] for m in by_object[obj])
 
     for other_subject in all_subjects:
         # Skip if it's a direct dependency
-        if other_subject in depends_on:
+        if other_subject in shared:
             continue
 
-        correlation = _compute_correlation(measurements, subject, other_subject)
+        if other_subject in candidates:
+            correlation = _profile_correlation(
+                subject_profile, profiles[other_subject], pool.get(subject), pool.get(other_subject)
+            )
+        else:
+            correlation = 0.0
 
         if correlation < independence_threshold:
             independent_of.append(other_subject)
@@ -140,6 +273,85 @@ def act_record(
             "Set confirm=True to proceed."
         )
 
+    measurement = _new_measurement(subject, predicate, obj, confidence, observer, evidence)
+
+    _append_measurement(measurement)
+
+    return {
+        "status": "recorded",
+        "measurement": measurement,
+        "message": f"Added: {subject} {predicate} {obj}",
+    }
+
+
+def act_record_many(
+    rows: list[dict],
+    *,
+    observer: str = "claude",
+    confirm: bool = False,
+) -> dict:
+    """
+    Add several measurements to graph in one write. Requires confirmation.
+
+    Each row is {"subject", "predicate", "object"} plus optional
+    "confidence", "observer" and "evidence", with the same meaning and the
+    same 0.7 ceiling as act_record. observer is the default for rows
+    without one.
+
+    Every row is validated before anything is written: a bad row records
+    nothing. The rows are appended with one write and flushed to disk with
+    one fsync.
+    """
+    if not confirm:
+        raise ValueError(
+            "Recording measurements requires explicit confirmation. "
+            "Set confirm=True to proceed."
+        )
+
+    for i, row in enumerate(rows):
+        missing = [key for key in ("subject", "predicate", "object") if key not in row]
+        if missing:
+            raise ValueError(f"Row {i} is missing {', '.join(missing)}")
+
+    logger.warning(f"RECORDING {len(rows)} measurements")
+
+    measurements = [
+        _new_measurement(
+            row["subject"],
+            row["predicate"],
+            row["object"],
+            row.get("confidence", 0.5),
+            row.get("observer", observer),
+            row.get("evidence"),
+        )
+        for row in rows
+    ]
+
+    lines = [_json_line(m) for m in measurements]
+    rows = [_cache_copy(m) for m in measurements]
+    if _pending_writes.lines is not None:
+        _pending_writes.lines.extend(lines)
+        _pending_writes.rows.extend(rows)
+    elif lines:
+        # A bulk insert is one unit: make it durable once, not per row
+        _write_lines(lines, rows, fsync=True)
+
+    return {
+        "status": "recorded",
+        "measurements": measurements,
+        "message": f"Added: {len(measurements)} measurements",
+    }
+
+
+def _new_measurement(
+    subject: str,
+    predicate: str,
+    obj: str,
+    confidence: float,
+    observer: str,
+    evidence: list[str] | None,
+) -> dict:
+    """Build a measurement, enforcing the confidence ceiling."""
     # Enforce confidence ceiling
     if confidence > 0.7 and not evidence:
         logger.warning(f"Confidence {confidence} capped at 0.7 (no evidence provided)")
@@ -150,7 +362,7 @@ def act_record(
 
     logger.warning(f"RECORDING: {subject} {predicate} {obj} (conf={confidence})")
 
-    measurement = {
+    return {
         "subject": subject,
         "predicate": predicate,
         "object": obj,
@@ -160,54 +372,398 @@ def act_record(
         "evidence": evidence or [],
     }
 
-    _append_measurement(measurement)
 
-    return {
-        "status": "recorded",
-        "measurement": measurement,
-        "message": f"Added: {subject} {predicate} {obj}",
-    }
+@contextmanager
+def act_record_batch():
+    """
+    Write every measurement recorded inside the block in a single append.
+
+        with act_record_batch():
+            act_record("auth", "requires", "identity", confirm=True)
+            act_record("auth", "requires", "session", confirm=True)
+
+    Each act_record still needs confirm=True. Measurements reach the graph
+    when the block exits (also on error), so reads inside the block do not
+    see them yet. Nested blocks join the outermost one. The block only
+    collects records made on its own thread.
+
+    The block is a group commit: one open, one write and one fsync for all
+    of it, where separate act_record calls pay an open and write each.
+    """
+    pending = _pending_writes
+    if pending.lines is not None:
+        yield
+        return
+
+    pending.lines, pending.rows = [], []
+    try:
+        yield
+    finally:
+        lines, rows = pending.lines, pending.rows
+        pending.lines, pending.rows = None, []
+        if lines:
+            _write_lines(lines, rows, fsync=True)
 
 
 # =============================================================================
 # Storage helpers
 # =============================================================================
 
+# NDJSON codec: orjson when installed (several times faster), stdlib otherwise.
+# Both read each other's output, so a graph can be written by either.
+# _json_line encodes one measurement as a complete NDJSON line, in bytes.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    _json_loads = json.loads
+
+    def _json_line(obj) -> bytes:
+        return (json.dumps(obj) + "\n").encode()
+
+
+def _graph_key() -> tuple:
+    """Identity of the graph file's current contents. Changes on every append."""
+    try:
+        st = GRAPH_FILE.stat()
+    except FileNotFoundError:
+        return (str(GRAPH_FILE), None)
+    return (str(GRAPH_FILE), st.st_ino, st.st_size, st.st_mtime_ns)
+
 
 def _load_measurements(subject: str) -> list[dict]:
     """Load all measurements for a subject."""
-    if not GRAPH_FILE.exists():
-        return []
+    return list(_load_index().by_subject.get(subject, []))
 
-    measurements = []
-    with open(GRAPH_FILE, "r") as f:
-        for line in f:
-            m = json.loads(line)
-            if m.get("subject") == subject:
-                measurements.append(m)
 
-    return measurements
+class _MeasurementIndex:
+    """
+    Lookups over one state of the graph, each computed on first use.
+
+    Built by _load_index and reused until the graph changes, so repeated
+    "which subjects exist?" questions cost one scan in total, not one each.
+    Everything returned is shared: treat it as read-only.
+    """
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.size = len(rows)
+
+    @cached_property
+    def by_subject(self) -> dict[str, list[dict]]:
+        by_subject: dict[str, list[dict]] = {}
+        for m in self.rows:
+            by_subject.setdefault(m["subject"], []).append(m)
+        return by_subject
+
+    @cached_property
+    def by_object(self) -> dict[str, list[dict]]:
+        by_object: dict[str, list[dict]] = {}
+        for m in self.rows:
+            by_object.setdefault(m["object"], []).append(m)
+        return by_object
+
+    @cached_property
+    def by_subject_observer(self) -> dict[tuple[str, str], list[dict]]:
+        by_pair: dict[tuple[str, str], list[dict]] = {}
+        for m in self.rows:
+            by_pair.setdefault((m["subject"], m["observer"]), []).append(m)
+        return by_pair
+
+    @cached_property
+    def objects_by_subject_observer(self) -> dict[tuple[str, str], dict[str, dict]]:
+        """(subject, observer) -> {object: that observer's latest row for it}."""
+        objects = {}
+        for pair, rows in self.by_subject_observer.items():
+            objects[pair] = {m["object"]: m for m in rows}
+        return objects
+
+    @cached_property
+    def subjects_by_observer(self) -> dict[str, set[str]]:
+        subjects: dict[str, set[str]] = {}
+        for subj, obs in self.by_subject_observer:
+            subjects.setdefault(obs, set()).add(subj)
+        return subjects
+
+    @cached_property
+    def subjects(self) -> set[str]:
+        return set(self.by_subject)
+
+    @cached_property
+    def objects(self) -> set[str]:
+        return set(self.by_object)
+
+    @cached_property
+    def pool(self) -> "_StringPool":
+        return _StringPool()
+
+    @cached_property
+    def profiles(self) -> dict[str, "_Profile"]:
+        return _build_profiles(self.rows, pool=self.pool)
+
+
+def _load_index() -> _MeasurementIndex:
+    """Index over the current graph, rebuilt only when new rows were loaded."""
+    return _cached_index(_load_all_measurements())
+
+
+def _cached_index(rows: list[dict]) -> _MeasurementIndex:
+    """The shared index for rows, which must be the loader's cached list."""
+    with _graph_lock:
+        index = _graph_cache.index
+        if index is None or index.rows is not rows or index.size != len(rows):
+            index = _graph_cache.index = _MeasurementIndex(rows)
+    return index
 
 
 def _load_all_measurements() -> list[dict]:
-    """Load all measurements."""
-    if not GRAPH_FILE.exists():
-        return []
+    """
+    Load all measurements.
 
-    measurements = []
-    with open(GRAPH_FILE, "r") as f:
-        for line in f:
-            measurements.append(json.loads(line))
+    The graph is append-only, so parsed rows are kept between calls and only
+    bytes appended since the last load are parsed. A file that shrank, was
+    replaced, or was rewritten in place is reloaded from the start. A
+    half-written last line is left for a later load.
 
-    return measurements
+    The returned list is shared with the cache: treat it as read-only.
+    """
+    with _graph_lock:
+        try:
+            st = GRAPH_FILE.stat()
+        except FileNotFoundError:
+            return []
+
+        cache = _graph_cache
+        if (
+            cache.path != GRAPH_FILE
+            or cache.inode != st.st_ino
+            or st.st_size < cache.offset
+            or (st.st_size == cache.offset and st.st_mtime_ns != cache.mtime_ns)
+        ):
+            _reset_graph_cache(st)
+
+        if st.st_size > cache.offset:
+            # Read only the new bytes, plus the last ones already parsed. A
+            # plain read() copes with the file being truncated by another
+            # process meanwhile: it just returns less.
+            with open(GRAPH_FILE, "rb") as f:
+                tail = cache.tail
+                start = cache.offset - len(tail)
+                f.seek(start)
+                if _FADV_SEQUENTIAL is not None:
+                    # Read front to back once: let the kernel read ahead
+                    # aggressively
+                    os.posix_fadvise(f.fileno(), start, 0, _FADV_SEQUENTIAL)
+                data = f.read()
+                # If the bytes we parsed last changed, this is not an append
+                # (e.g. unlinked and recreated with a recycled inode)
+                if not data.startswith(tail):
+                    _reset_graph_cache(st)
+                    f.seek(0)
+                    start, data = 0, f.read()
+
+            rows, end = _parse_lines(data, cache.offset - start)
+            cache.tail = data[max(0, end - 64):end]
+            _intern_fields(rows, cache.strings)
+            cache.rows.extend(rows)
+            cache.offset = start + end
+
+        cache.mtime_ns = st.st_mtime_ns
+        return cache.rows
+
+
+def _parse_lines(buf: bytes, start: int) -> tuple[list[dict], int]:
+    """
+    Parse the NDJSON lines of buf from byte start: (rows, offset parsed up to).
+
+    Another process may be mid-append: a last line without its newline is
+    kept only if it already parses, otherwise it is left for the next load.
+    """
+    end = max(buf.rfind(b"\n", start) + 1, start)
+    rows = []
+    loads, find = _json_loads, buf.find
+    pos = start
+    while pos < end:
+        newline = find(b"\n", pos, end)
+        line = buf[pos:newline]
+        if line.strip():
+            rows.append(loads(line))
+        pos = newline + 1
+
+    rest = buf[end:]
+    if rest.strip():
+        try:
+            rows.append(loads(rest))
+            end += len(rest)
+        except ValueError:
+            pass
+    return rows, end
+
+
+def _intern_fields(rows: list[dict], strings: dict):
+    """
+    Make repeated names one shared object: every row's subject, predicate,
+    object and observer is swapped for the first equal string seen.
+
+    A few names recur across thousands of rows, so this saves memory, and
+    equal names then compare by identity before any characters.
+    """
+    intern = strings.setdefault
+    for m in rows:
+        for field in ("subject", "predicate", "object", "observer"):
+            value = m.get(field)
+            if value is not None:
+                m[field] = intern(value, value)
+
+
+def _reset_graph_cache(st):
+    """Forget everything parsed so far; the next load starts from byte 0."""
+    cache = _graph_cache
+    cache.path, cache.inode = GRAPH_FILE, st.st_ino
+    cache.offset, cache.tail, cache.mtime_ns, cache.rows = 0, b"", None, []
+    # Seeded so loaded predicates become the very objects profiling looks up
+    cache.strings = {p: p for p in _STRONG_PREDICATES}
 
 
 def _append_measurement(measurement: dict):
-    """Append measurement to NDJSON file."""
-    GRAPH_FILE.parent.mkdir(parents=True, exist_ok=True)
+    """Append measurement to NDJSON file (deferred inside act_record_batch)."""
+    line = _json_line(measurement)
+    row = _cache_copy(measurement)
+    if _pending_writes.lines is not None:
+        _pending_writes.lines.append(line)
+        _pending_writes.rows.append(row)
+    else:
+        _write_lines([line], [row])
 
-    with open(GRAPH_FILE, "a") as f:
-        f.write(json.dumps(measurement) + "\n")
+
+def _cache_copy(measurement: dict) -> dict:
+    """measurement as the loader would parse it back: nothing shared with the caller."""
+    return dict(measurement, evidence=list(measurement["evidence"]))
+
+
+# Flags for appending to the graph: every write lands at the current end of
+# file, even with other processes appending too
+_APPEND_FLAGS = (
+    os.O_RDWR | os.O_APPEND | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_lines(lines: list[bytes], rows: list[dict] | None = None, fsync: bool = False):
+    """
+    Append NDJSON lines to the graph: one open, one write, optionally one fsync.
+
+    The lines go out in a single os.write on an O_APPEND descriptor - no
+    Python file object or buffer in between. The file is opened per call, not
+    kept open, since it may be unlinked and recreated between writes.
+
+    rows are the parsed lines. If the loader's cache was up to date just
+    before this write, they are added to it directly, so the next load has
+    nothing new to parse.
+    """
+    try:
+        fd = os.open(GRAPH_FILE, _APPEND_FLAGS, 0o644)
+    except FileNotFoundError:
+        GRAPH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(GRAPH_FILE, _APPEND_FLAGS, 0o644)
+
+    try:
+        data = b"".join(lines)
+        written = os.write(fd, data)
+        while written < len(data):  # Regular files rarely write short
+            written += os.write(fd, data[written:])
+        if fsync:
+            os.fsync(fd)
+        if rows is not None:
+            _extend_graph_cache(fd, data, rows)
+    finally:
+        os.close(fd)
+
+
+def _extend_graph_cache(fd: int, data: bytes, rows: list[dict]):
+    """Write-through for _write_lines: fd is the graph, data was just appended to it."""
+    with _graph_lock:
+        cache = _graph_cache
+        st = os.fstat(fd)
+        start = st.st_size - len(data)
+        if cache.path != GRAPH_FILE or cache.inode != st.st_ino or cache.offset != start:
+            return  # Cache was behind (or elsewhere): the next load catches up
+
+        # Same check as the loader: the bytes before ours must be the ones parsed
+        tail = cache.tail
+        os.lseek(fd, start - len(tail), os.SEEK_SET)
+        if os.read(fd, len(tail)) != tail:
+            return
+
+        _intern_fields(rows, cache.strings)
+        cache.rows.extend(rows)
+        cache.offset = st.st_size
+        cache.tail = (tail + data)[-64:]
+        cache.mtime_ns = st.st_mtime_ns
+
+
+# Bump whenever analyze_dependencies can give a different answer for the same
+# graph (correlation formula, result fields): saved analyses are then ignored
+_ANALYSIS_CACHE_VERSION = 1
+
+
+def _analysis_cache_dir() -> Path:
+    """Directory holding saved analyses: graph.ndjson.analysis next to the graph."""
+    return GRAPH_FILE.with_name(GRAPH_FILE.name + ".analysis")
+
+
+def _analysis_cache_path(graph_key: tuple, subject: str, threshold: float) -> Path:
+    """On-disk home of one analysis: <cache dir>/<graph state>/<subject, threshold>.json"""
+    state = hashlib.sha1(repr((_ANALYSIS_CACHE_VERSION, graph_key)).encode()).hexdigest()[:16]
+    entry = hashlib.sha1(repr((subject, threshold)).encode()).hexdigest()[:16]
+    return _analysis_cache_dir() / state / f"{entry}.json"
+
+
+def _is_state_dir(path: Path) -> bool:
+    """Whether path looks like a graph-state directory made by _analysis_cache_path."""
+    name = path.name
+    return len(name) == 16 and all(c in "0123456789abcdef" for c in name) and path.is_dir()
+
+
+def _read_cached_analysis(graph_key: tuple, subject: str, threshold: float):
+    """Analysis saved by an earlier process for this exact graph state, or None."""
+    if graph_key[1] is None:
+        return None
+    try:
+        text = _analysis_cache_path(graph_key, subject, threshold).read_text()
+        return DependencyGraph.model_validate_json(text)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_analysis(graph_key: tuple, subject: str, threshold: float, result):
+    """
+    Save an analysis for later sessions. Best effort: failures only cost speed.
+
+    Only the current graph state is kept - any append makes older states
+    unreachable, so their directories are removed when a new one is created.
+    Anything else in the cache directory is left alone.
+    """
+    if graph_key[1] is None:
+        return
+    path = _analysis_cache_path(graph_key, subject, threshold)
+    try:
+        try:
+            path.parent.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
+            for stale in path.parent.parent.iterdir():
+                if stale != path.parent and _is_state_dir(stale):
+                    shutil.rmtree(stale, ignore_errors=True)
+        # Write-then-rename, so readers never see a half-written file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(result.model_dump_json())
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Could not cache analysis for {subject}: {e}")
 
 
 def _compute_correlation(measurements: list[dict], subj_a: str, subj_b: str) -> float:
@@ -223,45 +779,241 @@ def _compute_correlation(measurements: list[dict], subj_a: str, subj_b: str) ->
     - Shared "uses" objects → weak correlation (shared infrastructure, not dependency)
     - Shared observers → weak correlation boost (same reference frame)
     - No overlap → zero correlation (coprime)
+
+    Called with the list returned by _load_all_measurements, the graph's
+    cached profiles are reused, so a series of pairs costs one pass in total.
+    For any other list each call profiles the two subjects afresh;
+    _compute_correlations_batch and _correlation_matrix score many pairs
+    from a single pass.
     """
-    # Track what each subject relates to, grouped by relationship strength
-    a_strong = set()  # requires, depends-on
-    b_strong = set()
-    a_weak = set()    # uses, has, etc
-    b_weak = set()
-    a_observers = set()
-    b_observers = set()
+    # A concept fully shares its own structure (the matrix diagonal)
+    if subj_a == subj_b:
+        return 1.0
+
+    if measurements is _graph_cache.rows:
+        # The loaded graph itself: its profiles are built once and shared
+        index = _cached_index(measurements)
+        profiles, pool = index.profiles, index.pool
+    else:
+        pool = _StringPool()
+        profiles = _build_profiles(measurements, subjects=(subj_a, subj_b), pool=pool)
+    return _profile_correlation(
+        profiles.get(subj_a, _EMPTY_PROFILE),
+        profiles.get(subj_b, _EMPTY_PROFILE),
+        pool.get(subj_a),
+        pool.get(subj_b),
+    )
 
-    # Check for direct divisibility (one appears as object of the other)
-    a_depends_on_b = False
-    b_depends_on_a = False
 
-    # Strong predicates indicate structural dependency
-    strong_predicates = {"requires", "depends-on", "needs", "composed-of"}
+def _compute_correlations_batch(
+    measurements: list[dict], pairs: list[tuple[str, str]]
+) -> dict[tuple[str, str], float]:
+    """
+    _compute_correlation for many (a, b) pairs, from a single pass over measurements.
 
+    Returns {(a, b): correlation} for each pair as given.
+    """
+    if measurements is _graph_cache.rows:
+        index = _cached_index(measurements)
+        profiles, pool = index.profiles, index.pool
+    else:
+        pool = _StringPool()
+        wanted = {subj for pair in pairs for subj in pair}
+        profiles = _build_profiles(measurements, subjects=wanted, pool=pool)
+
+    correlations = {}
+    for subj_a, subj_b in pairs:
+        if subj_a == subj_b:
+            correlations[(subj_a, subj_b)] = 1.0
+            continue
+        correlations[(subj_a, subj_b)] = _profile_correlation(
+            profiles.get(subj_a, _EMPTY_PROFILE),
+            profiles.get(subj_b, _EMPTY_PROFILE),
+            pool.get(subj_a),
+            pool.get(subj_b),
+        )
+    return correlations
+
+
+def _correlation_matrix(
+    measurements: list[dict], subjects: list[str] | None = None
+) -> dict[str, dict[str, float]]:
+    """
+    Correlation between every pair of subjects, from a single pass over measurements.
+
+    Returns matrix[a][b]. The diagonal is 1.0 (a concept fully shares its own structure).
+    Defaults to every subject in the graph.
+
+    Correlation is symmetric, so each unordered pair is computed once and mirrored.
+
+    Most pairs are never computed at all: correlation is zero unless the two
+    subjects share an object or one is the other's object. Inverting the
+    profiles (object → subjects holding it) yields exactly those pairs, so
+    the work scales with shared structure rather than with N².
+    """
+    pool = _StringPool()
+    profiles = _build_profiles(measurements, pool=pool)
+    if subjects is None:
+        subjects = list(profiles)
+
+    position = {subj: i for i, subj in enumerate(subjects)}
+    matrix = {subj: dict.fromkeys(subjects, 0.0) for subj in subjects}
+    for subj in subjects:
+        matrix[subj][subj] = 1.0
+
+    # Subjects holding each object, separately for strong and weak relations
+    holders: dict[tuple[str, int], list[str]] = {}
+    for subj in subjects:
+        profile = profiles.get(subj)
+        if profile is None:
+            continue
+        for obj in profile["strong"]:
+            holders.setdefault(("strong", obj), []).append(subj)
+        for obj in profile["weak"]:
+            holders.setdefault(("weak", obj), []).append(subj)
+
+    # Candidate pairs, ordered by position so each is visited once
+    pairs = set()
+    for group in holders.values():
+        for i, subj_a in enumerate(group):
+            for subj_b in group[i + 1:]:
+                pairs.add((subj_a, subj_b))
+    for subj_a in subjects:
+        for obj in profiles.get(subj_a, _EMPTY_PROFILE)["objects"]:
+            subj_b = pool.names[obj]
+            if subj_b in position and subj_b != subj_a:
+                pairs.add((subj_a, subj_b) if position[subj_a] < position[subj_b] else (subj_b, subj_a))
+
+    for subj_a, subj_b in pairs:
+        correlation = _profile_correlation(
+            profiles.get(subj_a, _EMPTY_PROFILE),
+            profiles.get(subj_b, _EMPTY_PROFILE),
+            pool.get(subj_a),
+            pool.get(subj_b),
+        )
+        matrix[subj_a][subj_b] = correlation
+        matrix[subj_b][subj_a] = correlation
+
+    return matrix
+
+
+# Strong predicates indicate structural dependency. Interned so they are the
+# same objects as the interned predicates of loaded rows: set lookups then
+# match on identity without comparing characters.
+_STRONG_PREDICATES = frozenset(
+    sys.intern(p) for p in ("requires", "depends-on", "needs", "composed-of")
+)
+
+class _Profile(TypedDict):
+    """What one subject relates to; see _build_profiles."""
+
+    strong: set[int]
+    weak: set[int]
+    objects: set[int]
+    observers: int
+
+
+# Profile of a subject that has no measurements (shared: never modify)
+_EMPTY_PROFILE: _Profile = {"strong": set(), "weak": set(), "objects": set(), "observers": 0}
+
+
+class _StringPool:
+    """
+    Small int code per distinct string, assigned on first sight.
+
+    Profiles hold codes rather than strings, so their set algebra hashes and
+    compares ints. names[code] turns a code back into its string.
+
+    Observers are coded separately, as one bit each (observer_bits), so an
+    observer mask is as wide as the number of observers rather than the
+    number of names in the graph.
+    """
+
+    def __init__(self) -> None:
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+        self.observer_bits: dict[str, int] = {}
+
+    def code(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def get(self, name: str) -> int | None:
+        """Code of name, or None if it was never seen."""
+        return self.codes.get(name)
+
+
+def _build_profiles(
+    measurements: list[dict], subjects=None, pool: _StringPool | None = None
+) -> dict[str, _Profile]:
+    """
+    Group what each subject relates to, in one pass over the measurements.
+
+    profile = {"strong": objects via requires/depends-on/...,
+               "weak": objects via uses/has/...,
+               "objects": strong | weak, for the direct-dependency check,
+               "observers": frames that measured the subject, as a bitmask}
+
+    Objects are stored as codes from pool (a fresh pool if none is given),
+    observers as their bits from pool.observer_bits. Compare profiles built
+    from the same pool only.
+    If subjects is given, only those subjects are profiled.
+    """
+    if pool is None:
+        pool = _StringPool()
+    code = pool.code
+    observer_bits = pool.observer_bits
+    strong_predicates = _STRONG_PREDICATES
+
+    profiles: dict[str, _Profile] = {}
     for m in measurements:
-        if m["subject"] == subj_a:
-            if m["predicate"] in strong_predicates:
-                a_strong.add(m["object"])
-            else:
-                a_weak.add(m["object"])
-            a_observers.add(m["observer"])
-            if m["object"] == subj_b:
-                a_depends_on_b = True
-
-        if m["subject"] == subj_b:
-            if m["predicate"] in strong_predicates:
-                b_strong.add(m["object"])
-            else:
-                b_weak.add(m["object"])
-            b_observers.add(m["observer"])
-            if m["object"] == subj_a:
-                b_depends_on_a = True
+        subj = m["subject"]
+        if subjects is not None and subj not in subjects:
+            continue
+
+        profile = profiles.get(subj)
+        if profile is None:
+            profile = profiles[subj] = {
+                "strong": set(), "weak": set(), "objects": set(), "observers": 0,
+            }
+
+        obj = code(m["object"])
+        if m["predicate"] in strong_predicates:
+            profile["strong"].add(obj)
+        else:
+            profile["weak"].add(obj)
+        profile["objects"].add(obj)
+        bit = observer_bits.get(m["observer"])
+        if bit is None:
+            bit = observer_bits[m["observer"]] = 1 << len(observer_bits)
+        profile["observers"] |= bit
+
+    return profiles
+
+
+def _profile_correlation(
+    profile_a: _Profile, profile_b: _Profile, code_a: int | None, code_b: int | None
+) -> float:
+    """
+    Correlation between two precomputed subject profiles (see _compute_correlation).
+
+    code_a / code_b are the subjects' codes in the profiles' pool (None if
+    the name never occurs in the graph).
+    """
+    a_strong, a_weak = profile_a["strong"], profile_a["weak"]
+    b_strong, b_weak = profile_b["strong"], profile_b["weak"]
 
     # Direct dependency = strong correlation (one divides the other)
-    if a_depends_on_b or b_depends_on_a:
+    if code_b in profile_a["objects"] or code_a in profile_b["objects"]:
         return 0.8
 
+    # No common object (including one side having none): nothing to overlap
+    if profile_a["objects"].isdisjoint(profile_b["objects"]):
+        return 0.0
+
     # Shared STRONG dependencies = high correlation (shared prime factors)
     shared_strong = a_strong & b_strong
     all_strong = a_strong | b_strong
@@ -270,9 +1022,9 @@ def _compute_correlation(measurements: list[dict], subj_a: str, subj_b: str) ->
     shared_weak = a_weak & b_weak
     all_weak = a_weak | b_weak
 
-    # Shared observers = same reference frame
-    shared_observers = a_observers & b_observers
-    all_observers = a_observers | b_observers
+    # Shared observers = same reference frame (bitmasks: & and | plus a popcount)
+    shared_observers = (profile_a["observers"] & profile_b["observers"]).bit_count()
+    all_observers = (profile_a["observers"] | profile_b["observers"]).bit_count()
 
     # If no objects at all, zero correlation
     if not (all_strong or all_weak):
@@ -285,7 +1037,7 @@ def _compute_correlation(measurements: list[dict], subj_a: str, subj_b: str) ->
     weak_overlap = len(shared_weak) / len(all_weak) if all_weak else 0
 
     # Observer overlap (tertiary signal)
-    observer_overlap = len(shared_observers) / len(all_observers) if all_observers else 0
+    observer_overlap = shared_observers / all_observers if all_observers else 0
 
     # Weighted combination:
     # - Strong dependencies dominate (0.7)
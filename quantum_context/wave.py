@@ -12,7 +12,9 @@ The wave only lands at integer values.
 
 import math
 import logging
+from bisect import bisect_left
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from quantum_context.models import WaveAmplitude
@@ -48,6 +50,7 @@ def compute_phase(measurements: list[dict], reference_time: Optional[str] = None
 
     # Temporal offsets in hours from reference, weighted by confidence
     weighted_offsets = []
+    offsets = []
     total_weight = 0.0
 
     for m in measurements:
@@ -56,6 +59,7 @@ def compute_phase(measurements: list[dict], reference_time: Optional[str] = None
             offset_hours = (t - ref).total_seconds() / 3600.0
             weight = m.get("confidence", 0.5)
             weighted_offsets.append(offset_hours * weight)
+            offsets.append(offset_hours)
             total_weight += weight
         except (KeyError, ValueError):
             continue
@@ -71,21 +75,13 @@ def compute_phase(measurements: list[dict], reference_time: Optional[str] = None
     # has its own natural frequency based on how often it gets measured.
     # Concepts measured in bursts have high frequency (short period).
     # Concepts measured slowly have low frequency (long period).
-    timestamps = []
-    for m in measurements:
-        try:
-            timestamps.append(_parse_time(m["timestamp"]))
-        except (KeyError, ValueError):
-            continue
-
-    if len(timestamps) < 2:
+    if len(offsets) < 2:
         # Single measurement: phase is just the offset mapped to [0, 2π)
         # Use a 24-hour natural period (one rotation per day)
         phase = (centroid / 24.0) * 2 * math.pi
         return phase % (2 * math.pi)
 
     # Natural period = temporal spread of this concept's measurements
-    offsets = [(t - ref).total_seconds() / 3600.0 for t in timestamps]
     spread = max(offsets) - min(offsets)
 
     if spread < 0.001:  # All measurements at same time
@@ -228,23 +224,34 @@ def _pairwise_phase_diff(
     times_b = []
 
     for m in measurements:
+        subject, obj = m.get("subject"), m.get("object")
+        in_a = subject == entity_a or obj == entity_a
+        in_b = subject == entity_b or obj == entity_b
+        # Callers pass the whole graph: only the pair's own rows need a timestamp
+        if not (in_a or in_b):
+            continue
+
         try:
             t = _parse_time(m["timestamp"])
         except (KeyError, ValueError):
             continue
 
-        if m.get("subject") == entity_a or m.get("object") == entity_a:
+        if in_a:
             times_a.append(t)
-        if m.get("subject") == entity_b or m.get("object") == entity_b:
+        if in_b:
             times_b.append(t)
 
     if not times_a or not times_b:
         return math.pi  # No data → maximally out of phase
 
-    # For each measurement of A, find the minimum time gap to any measurement of B
+    # For each measurement of A, find the minimum time gap to any measurement of B.
+    # With B's times sorted, the nearest is one of the two around A's time.
+    times_b.sort()
     min_gaps = []
     for ta in times_a:
-        gaps = [abs((ta - tb).total_seconds()) / 3600.0 for tb in times_b]
+        i = bisect_left(times_b, ta)
+        nearest = times_b[max(i - 1, 0):i + 1]
+        gaps = [abs((ta - tb).total_seconds()) / 3600.0 for tb in nearest]
         min_gaps.append(min(gaps))
 
     # Average minimum gap (hours)
@@ -295,18 +302,16 @@ def compute_wave(
 
     # Magnitude: confidence-weighted, normalized by measurement count
     # More measurements with high confidence = higher magnitude
-    confidences = [m.get("confidence", 0.5) for m in subject_measurements]
-    magnitude = sum(confidences) / len(confidences)
-
     # Per-predicate coefficients (spectral decomposition)
     # Each predicate type is a "frequency" — how this concept vibrates
+    # (both gathered in one pass over the measurements)
+    total_confidence = 0
     predicate_strengths = {}
     for m in subject_measurements:
-        pred = m.get("predicate", "unknown")
         conf = m.get("confidence", 0.5)
-        if pred not in predicate_strengths:
-            predicate_strengths[pred] = []
-        predicate_strengths[pred].append(conf)
+        total_confidence += conf
+        predicate_strengths.setdefault(m.get("predicate", "unknown"), []).append(conf)
+    magnitude = total_confidence / len(subject_measurements)
 
     # Coefficient for each predicate = average confidence of that relationship type
     coefficients = [
@@ -334,11 +339,25 @@ def compute_wave(
 # =============================================================================
 
 
+@lru_cache(maxsize=65536)
 def _parse_time(ts: str) -> datetime:
-    """Parse ISO timestamp, tolerant of common formats."""
-    for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+    """
+    Parse ISO timestamp, tolerant of common formats.
+
+    Cached: the same stored timestamps are parsed again on every observe
+    and interference call, and datetimes are immutable.
+
+    fromisoformat (C, no format-string interpretation) reads what
+    datetime.isoformat writes; strptime only handles the looser shapes it
+    rejects, such as unpadded fields or odd fraction widths before 3.11.
+    """
+    try:
+        return datetime.fromisoformat(ts)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"):
         try:
             return datetime.strptime(ts, fmt)
         except ValueError:
             continue
-    return datetime.fromisoformat(ts)
+    return datetime.strptime(ts, "%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,383 @@
+"""
+Tests for the NDJSON storage layer and the caches built on top of it.
+
+The graph file is append-only shared reality. Caches may only ever make
+reads cheaper - they must never make a read stale.
+"""
+
+import json
+import sys
+import threading
+
+import pytest
+
+from quantum_context import core
+
+
+@pytest.fixture
+def graph(tmp_path, monkeypatch):
+    """Point the core at an empty graph file in a temp dir."""
+    path = tmp_path / "graph.ndjson"
+    monkeypatch.setattr(core, "GRAPH_FILE", path)
+    return path
+
+
+def _record(subject, predicate, obj, **kwargs):
+    return core.act_record(subject, predicate, obj, confirm=True, **kwargs)
+
+
+# =============================================================================
+# Incremental loading
+# =============================================================================
+
+
+def test_missing_graph_loads_empty(graph):
+    assert core._load_all_measurements() == []
+
+
+def test_appends_are_visible_to_next_load(graph):
+    _record("auth", "requires", "identity")
+    assert len(core._load_all_measurements()) == 1
+
+    _record("auth", "uses", "database")
+    rows = core._load_all_measurements()
+    assert [m["object"] for m in rows] == ["identity", "database"]
+
+
+def test_external_append_is_picked_up(graph):
+    """Another process appending to the file is seen without a restart."""
+    _record("auth", "requires", "identity")
+    core._load_all_measurements()
+
+    with open(graph, "a") as f:
+        f.write(json.dumps({"subject": "payment", "predicate": "requires", "object": "card",
+                            "confidence": 0.5, "observer": "bob",
+                            "timestamp": "2026-02-05T11:00:00", "evidence": []}) + "\n")
+
+    assert [m["subject"] for m in core._load_all_measurements()] == ["auth", "payment"]
+
+
+def test_half_written_line_is_read_once_complete(graph):
+    _record("auth", "requires", "identity")
+    line = json.dumps({"subject": "payment", "predicate": "requires", "object": "card",
+                       "confidence": 0.5, "observer": "bob",
+                       "timestamp": "2026-02-05T11:00:00", "evidence": []}) + "\n"
+
+    with open(graph, "a") as f:
+        f.write(line[:20])
+    assert [m["subject"] for m in core._load_all_measurements()] == ["auth"]
+
+    with open(graph, "a") as f:
+        f.write(line[20:])
+    assert [m["subject"] for m in core._load_all_measurements()] == ["auth", "payment"]
+
+
+def test_ndjson_export_skips_blank_and_half_written_lines(graph, monkeypatch, capsysbinary):
+    from quantum_context import __main__ as cli
+
+    monkeypatch.setattr(cli, "GRAPH_FILE", graph)
+    _record("auth", "requires", "identity")
+    with open(graph, "a") as f:
+        f.write("\n" + json.dumps({"subject": "payment"})[:10])
+
+    cli.cmd_export(type("Args", (), {"format": "ndjson"}))
+    lines = capsysbinary.readouterr().out.splitlines()
+    assert [json.loads(line)["subject"] for line in lines] == ["auth"]
+
+
+def test_repeated_names_share_one_string(graph):
+    _record("auth", "requires", "identity")
+    core._load_all_measurements()
+    with open(graph, "a") as f:
+        f.write(json.dumps({"subject": "auth", "predicate": "uses", "object": "identity",
+                            "confidence": 0.5, "observer": "claude",
+                            "timestamp": "2026-02-05T11:00:00", "evidence": []}) + "\n")
+
+    first, second = core._load_all_measurements()
+    assert second["subject"] is first["subject"]
+    assert second["object"] is first["object"]
+    assert second["observer"] is first["observer"]
+    assert first["predicate"] is sys.intern("requires")
+
+
+def test_graph_truncated_while_loading_reads_as_empty(graph, monkeypatch):
+    _record("auth", "requires", "identity")
+    monkeypatch.setattr(core, "_graph_cache", core._GraphCache())
+
+    # Another process empties the file between our stat() and our read
+    def truncate_then_open(path, *args, **kwargs):
+        open(path, "w").close()
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(core, "open", truncate_then_open, raising=False)
+    assert core._load_all_measurements() == []
+
+
+def test_concurrent_first_loads_parse_the_graph_once(graph, monkeypatch):
+    line = json.dumps({"subject": "auth", "predicate": "requires", "object": "identity",
+                       "confidence": 0.5, "observer": "claude",
+                       "timestamp": "2026-02-05T11:00:00", "evidence": []}) + "\n"
+    graph.write_text(line * 20000)
+    monkeypatch.setattr(core, "_graph_cache", core._GraphCache())
+
+    barrier = threading.Barrier(4)
+
+    def load():
+        barrier.wait()
+        core._load_all_measurements()
+
+    workers = [threading.Thread(target=load) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(core._load_all_measurements()) == 20000
+
+
+def test_recreated_graph_is_reloaded_from_scratch(graph):
+    """Examples unlink the graph and start over - old rows must not survive."""
+    _record("auth", "requires", "identity")
+    _record("auth", "requires", "session")
+    core._load_all_measurements()
+
+    graph.unlink()
+    _record("payment", "requires", "card")
+
+    assert [m["subject"] for m in core._load_all_measurements()] == ["payment"]
+
+
+def test_analysis_follows_graph_changes(graph):
+    _record("auth", "requires", "identity")
+    _record("payment", "uses", "database")
+    assert core.analyze_dependencies("auth").independent_of == ["payment"]
+
+    _record("auth", "requires", "payment")
+    result = core.analyze_dependencies("auth")
+    assert result.depends_on == ["identity", "payment"]
+    assert result.independent_of == []
+
+
+def test_cached_analysis_is_not_shared_with_callers(graph):
+    _record("auth", "requires", "identity")
+
+    first = core.analyze_dependencies("auth")
+    first.depends_on.append("mutated")
+
+    assert core.analyze_dependencies("auth").depends_on == ["identity"]
+
+
+def test_rewritten_graph_of_larger_size_is_reloaded(graph):
+    """Same inode, larger file, different content: not an append."""
+    _record("auth", "requires", "identity")
+    core._load_all_measurements()
+
+    rows = [{"subject": f"s{i}", "predicate": "uses", "object": "db", "confidence": 0.5,
+             "observer": "bob", "timestamp": "2026-02-05T11:00:00", "evidence": []}
+            for i in range(3)]
+    with open(graph, "w") as f:
+        f.write("".join(json.dumps(m) + "\n" for m in rows))
+
+    assert [m["subject"] for m in core._load_all_measurements()] == ["s0", "s1", "s2"]
+
+
+def test_index_is_rebuilt_after_append(graph):
+    _record("auth", "requires", "identity")
+    assert core._load_index().subjects == {"auth"}
+    assert core._load_index() is core._load_index()
+
+    _record("payment", "uses", "database")
+    index = core._load_index()
+    assert index.subjects == {"auth", "payment"}
+    assert index.objects == {"identity", "database"}
+    assert [m["object"] for m in index.by_subject["payment"]] == ["database"]
+
+
+def test_own_appends_are_not_parsed_again(graph, monkeypatch):
+    _record("auth", "requires", "identity")
+    core._load_all_measurements()
+
+    monkeypatch.setattr(core, "_json_loads", None)
+    result = _record("auth", "uses", "database", evidence=["https://example.org"])
+    result["measurement"]["evidence"].append("mutated")
+
+    rows = core._load_all_measurements()
+    assert [m["object"] for m in rows] == ["identity", "database"]
+    assert rows[1]["evidence"] == ["https://example.org"]
+
+
+def test_batch_writes_once_on_exit(graph, monkeypatch):
+    syncs = []
+    monkeypatch.setattr(core.os, "fsync", syncs.append)
+
+    with core.act_record_batch():
+        _record("auth", "requires", "identity")
+        _record("auth", "uses", "database")
+        assert not graph.exists()
+
+    assert [m["object"] for m in core._load_all_measurements()] == ["identity", "database"]
+    assert len(syncs) == 1
+
+
+def test_batch_does_not_capture_other_threads(graph):
+    with core.act_record_batch():
+        _record("auth", "requires", "identity")
+        worker = threading.Thread(target=_record, args=("billing", "uses", "ledger"))
+        worker.start()
+        worker.join()
+        assert [m["subject"] for m in core._load_all_measurements()] == ["billing"]
+
+    assert {m["subject"] for m in core._load_all_measurements()} == {"auth", "billing"}
+
+
+def test_batch_flushes_on_error(graph):
+    with pytest.raises(RuntimeError):
+        with core.act_record_batch():
+            _record("auth", "requires", "identity")
+            raise RuntimeError("interrupted")
+
+    assert len(core._load_all_measurements()) == 1
+
+
+def test_analyze_all_matches_per_subject_analysis(graph):
+    _record("auth", "requires", "identity")
+    _record("billing", "requires", "identity")
+    _record("search", "uses", "index")
+
+    everything = core.analyze_all()
+
+    assert set(everything) == {"auth", "billing", "search"}
+    core._analysis_cache.results.clear()
+    for subject, result in everything.items():
+        assert result == core.analyze_dependencies(subject)
+
+
+def test_analysis_is_reused_across_sessions(graph, monkeypatch):
+    _record("auth", "requires", "identity")
+    first = core.analyze_dependencies("auth")
+    assert list(core._analysis_cache_dir().iterdir())
+
+    # A new process starts with empty in-memory caches and must not recompute
+    monkeypatch.setattr(core, "_analysis_cache", core._AnalysisCache())
+    monkeypatch.setattr(core, "_load_index", None)
+    assert core.analyze_dependencies("auth") == first
+
+
+def test_saving_analyses_leaves_other_files_alone(graph):
+    (graph.parent / "cache" / "important").mkdir(parents=True)
+    (graph.parent / "cache" / "important" / "file.txt").write_text("keep")
+    (core._analysis_cache_dir() / "notes").mkdir(parents=True)
+
+    _record("auth", "requires", "identity")
+    core.analyze_dependencies("auth")
+    _record("auth", "uses", "logging")
+    core.analyze_dependencies("auth")
+
+    assert (graph.parent / "cache" / "important" / "file.txt").read_text() == "keep"
+    assert (core._analysis_cache_dir() / "notes").is_dir()
+    # Only the latest graph state's analyses are kept
+    assert len([p for p in core._analysis_cache_dir().iterdir() if core._is_state_dir(p)]) == 1
+
+
+def test_saved_analyses_are_ignored_after_a_format_change(graph, monkeypatch):
+    _record("auth", "requires", "identity")
+    core.analyze_dependencies("auth")
+    key = core._graph_key()
+    assert core._read_cached_analysis(key, "auth", 0.3) is not None
+
+    monkeypatch.setattr(core, "_ANALYSIS_CACHE_VERSION", core._ANALYSIS_CACHE_VERSION + 1)
+    assert core._read_cached_analysis(key, "auth", 0.3) is None
+
+
+def test_record_many_applies_ceiling_and_default_observer(graph):
+    result = core.act_record_many([
+        {"subject": "auth", "predicate": "requires", "object": "identity", "confidence": 0.9},
+        {"subject": "auth", "predicate": "uses", "object": "database", "observer": "bob"},
+    ], observer="alice", confirm=True)
+
+    rows = core._load_all_measurements()
+    assert rows == result["measurements"]
+    assert [(m["confidence"], m["observer"]) for m in rows] == [(0.7, "alice"), (0.5, "bob")]
+
+
+def test_record_many_writes_nothing_if_a_row_is_invalid(graph):
+    with pytest.raises(ValueError):
+        core.act_record_many([
+            {"subject": "auth", "predicate": "requires", "object": "identity"},
+            {"subject": "auth", "predicate": "requires"},
+        ], confirm=True)
+
+    assert core._load_all_measurements() == []
+
+
+def test_correlation_on_loaded_graph_reuses_profiles(graph, monkeypatch):
+    _record("auth", "requires", "identity")
+    _record("session", "requires", "identity")
+    rows = core._load_all_measurements()
+    expected = core._compute_correlation(list(rows), "auth", "session")
+
+    assert core._compute_correlation(rows, "auth", "session") == expected
+    monkeypatch.setattr(core, "_build_profiles", None)
+    assert core._compute_correlation(rows, "session", "auth") == expected
+
+
+def test_observer_masks_are_as_wide_as_the_observers():
+    rows = [
+        {"subject": f"s{i}", "predicate": "uses", "object": f"o{i}", "observer": obs}
+        for i in range(200)
+        for obs in ("claude", "hallie")
+    ]
+    profiles = core._build_profiles(rows)
+
+    assert max(p["observers"] for p in profiles.values()).bit_length() == 2
+
+
+def test_batch_correlations_match_pairwise():
+    rows = [
+        {"subject": "auth", "predicate": "requires", "object": "identity", "observer": "alice"},
+        {"subject": "session", "predicate": "requires", "object": "identity", "observer": "alice"},
+        {"subject": "payment", "predicate": "uses", "object": "auth", "observer": "bob"},
+    ]
+    pairs = [("auth", "session"), ("payment", "auth"), ("auth", "auth"), ("auth", "missing")]
+
+    batch = core._compute_correlations_batch(rows, pairs)
+
+    assert batch == {pair: core._compute_correlation(rows, *pair) for pair in pairs}
+    assert batch[("payment", "auth")] == 0.8
+
+
+def test_bias_detection_loads_graph_once(graph, monkeypatch):
+    from quantum_context.compare import detect_systematic_bias
+
+    for subject in ("auth", "payment", "session"):
+        _record(subject, "requires", "identity", confidence=0.4, observer="alice")
+        _record(subject, "requires", "identity", confidence=0.6, observer="claude")
+
+    loads = []
+    load_index = core._load_index
+    monkeypatch.setattr(core, "_load_index", lambda: loads.append(1) or load_index())
+    monkeypatch.setattr("quantum_context.compare._load_index", core._load_index)
+
+    result = detect_systematic_bias("alice")
+    assert result["sample_size"] == 3
+    assert result["average_confidence_delta"] == pytest.approx(0.2)
+    assert len(loads) == 1
+
+
+def test_bias_detection_is_reused_until_the_graph_changes(graph, monkeypatch):
+    from quantum_context import compare
+
+    for subject in ("auth", "payment", "session"):
+        _record(subject, "requires", "identity", confidence=0.4, observer="alice")
+        _record(subject, "requires", "identity", confidence=0.6, observer="claude")
+
+    first = compare.detect_systematic_bias("alice")
+    first["shared_subjects"].append("mutated")
+
+    detect = compare._detect_systematic_bias
+    monkeypatch.setattr(compare, "_detect_systematic_bias", None)
+    assert "mutated" not in compare.detect_systematic_bias("alice")["shared_subjects"]
+
+    monkeypatch.setattr(compare, "_detect_systematic_bias", detect)
+    _record("billing", "requires", "identity", observer="claude")
+    assert compare.detect_systematic_bias("alice")["blind_spots"] == ["billing"]